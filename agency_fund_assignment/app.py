@@ -9,14 +9,20 @@ Clean, modular architecture with:
 - Proper error handling
 """
 
-from src.api import create_app
+from src.api import create_app, start_prefetch
 from src.config import get_config
 
 
 def main():
-    """Run the Flask application."""
+    """
+    Run the Flask development server.
+
+    For production, serve `wsgi:app` with gunicorn instead
+    (see gunicorn.conf.py).
+    """
     config = get_config()
     app = create_app(config)
+    start_prefetch(app)
 
     print("=" * 60)
     print("Rick & Morty AI Challenge - Clean Architecture")
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration.
+
+Gevent workers let many slow, I/O-bound upstream calls (Gemini and the
+Rick and Morty API) be in flight at once. Gunicorn's gevent worker
+monkey-patches the standard library before the app is loaded, so
+`requests` calls yield without any changes to application code.
+"""
+
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '127.0.0.1')}:{os.getenv('FLASK_PORT', '5000')}"
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+worker_class = "gevent"
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "200"))
+
+# Generative endpoints can take several seconds upstream
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+
+def post_worker_init(worker):
+    """Warm cached responses once the worker has loaded the app."""
+    from src.api import start_prefetch
+    start_prefetch(worker.wsgi)
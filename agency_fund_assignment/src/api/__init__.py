@@ -1,5 +1,7 @@
 """API routes package."""
 
+import threading
+
 from flask import Flask
 from .routes import register_blueprints
 
@@ -16,8 +18,10 @@ def create_app(config=None) -> Flask:
     """
     from src.config import get_config
     from src.database import get_db_connection, init_database
+    from .serialization import ORJSONProvider
 
     app = Flask(__name__, static_folder='../../')
+    app.json = ORJSONProvider(app)
 
     # Load configuration
     app_config = config or get_config()
@@ -39,6 +43,11 @@ def create_app(config=None) -> Flask:
 def _register_error_handlers(app: Flask) -> None:
     """Register global error handlers."""
     from src.utils import AppException
+    from .serialization import dumps
+
+    # Static error bodies are encoded once instead of per response
+    not_found_body = dumps({"success": False, "error": "Resource not found"})
+    server_error_body = dumps({"success": False, "error": "Internal server error"})
 
     @app.errorhandler(AppException)
     def handle_app_exception(error: AppException):
@@ -48,12 +57,26 @@ def _register_error_handlers(app: Flask) -> None:
     @app.errorhandler(404)
     def handle_404(error):
         """Handle 404 errors."""
-        return {"success": False, "error": "Resource not found"}, 404
+        return app.response_class(not_found_body, status=404, mimetype='application/json')
 
     @app.errorhandler(500)
     def handle_500(error):
         """Handle 500 errors."""
-        return {"success": False, "error": "Internal server error"}, 500
+        return app.response_class(server_error_body, status=500, mimetype='application/json')
+
+
+def start_prefetch(app: Flask) -> None:
+    """
+    Build cached response bodies in the background.
+
+    Called by the server entry points once the app is loaded, so tests
+    and scripts that only create the app make no upstream requests.
+
+    Args:
+        app: Flask application instance
+    """
+    for warm in app.extensions.get('prefetch', []):
+        threading.Thread(target=warm, daemon=True).start()
 
 
-__all__ = ["create_app"]
+__all__ = ["create_app", "start_prefetch"]
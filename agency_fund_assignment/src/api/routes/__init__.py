@@ -24,16 +24,8 @@ def register_blueprints(app: Flask) -> None:
     # Initialize services (dependency injection)
     from src.config import get_config
     from src.database import get_db_connection
-    from src.repositories import (
-        NoteRepository,
-        CacheRepository,
-        EmbeddingRepository
-    )
-    from src.services import (
-        RickMortyService,
-        GeminiService,
-        SearchService
-    )
+    from src.repositories import NoteRepository, CacheRepository, EmbeddingCacheRepository
+    from src.services import RickMortyService
 
     config = get_config()
     db = get_db_connection()
@@ -41,15 +33,24 @@ def register_blueprints(app: Flask) -> None:
     # Repositories
     note_repo = NoteRepository(db)
     cache_repo = CacheRepository(db)
-    embedding_repo = EmbeddingRepository(db)
 
     # Services
     rick_morty_service = RickMortyService(cache_repo, config.api)
 
     try:
-        gemini_service = GeminiService(config.gemini)
+        # The AI stack (google.generativeai, numpy) is only imported when
+        # Gemini is configured
+        from src.services import GeminiService
+        gemini_service = GeminiService(
+            config.gemini,
+            cache_repo,
+            EmbeddingCacheRepository(db)
+        )
+
+        from src.repositories import EmbeddingRepository
+        from src.services import SearchService
         search_service = SearchService(
-            embedding_repo,
+            EmbeddingRepository(db),
             gemini_service,
             rick_morty_service
         )
@@ -62,7 +63,9 @@ def register_blueprints(app: Flask) -> None:
 
     # Register blueprints with dependencies
     app.register_blueprint(create_health_blueprint(gemini_available))
-    app.register_blueprint(create_locations_blueprint(rick_morty_service))
+    app.register_blueprint(
+        create_locations_blueprint(rick_morty_service, config.api.cache_ttl_minutes)
+    )
     app.register_blueprint(create_characters_blueprint(rick_morty_service, note_repo))
     app.register_blueprint(create_notes_blueprint(note_repo))
 
@@ -1,13 +1,28 @@
 """AI feature routes."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 from flask import Blueprint, jsonify, request
-from src.services import GeminiService, RickMortyService
+from src.services import RickMortyService
 from src.services.image_service import ImageGenerationService
 from src.utils import ValidationError
 
+if TYPE_CHECKING:
+    from src.services import GeminiService
+
+# Shared pool for fanning out independent upstream lookups
+_pool = ThreadPoolExecutor(max_workers=8)
+
+_DIALOGUE_REQUIRED = frozenset({'character1_id', 'character2_id'})
+_DIALOGUE_ERROR = "Missing required fields: character1_id, character2_id"
+
+_FACTUAL_REQUIRED = frozenset({'generated_text', 'source_data'})
+_FACTUAL_ERROR = "Missing required fields: generated_text, source_data"
+
 
 def create_ai_blueprint(
-    gemini_service: GeminiService,
+    gemini_service: "GeminiService",
     rick_morty_service: RickMortyService,
     image_service: ImageGenerationService = None
 ) -> Blueprint:
@@ -47,14 +62,13 @@ def create_ai_blueprint(
         """Generate dialogue between two characters."""
         data = request.get_json()
 
-        required_fields = ['character1_id', 'character2_id']
-        if not all(field in data for field in required_fields):
-            raise ValidationError(
-                f"Missing required fields: {', '.join(required_fields)}"
-            )
+        if not _DIALOGUE_REQUIRED.issubset(data):
+            raise ValidationError(_DIALOGUE_ERROR)
 
-        char1 = rick_morty_service.get_character(data['character1_id'])
-        char2 = rick_morty_service.get_character(data['character2_id'])
+        # Fetch both characters concurrently
+        future1 = _pool.submit(rick_morty_service.get_character, data['character1_id'])
+        future2 = _pool.submit(rick_morty_service.get_character, data['character2_id'])
+        char1, char2 = future1.result(), future2.result()
 
         dialogue = gemini_service.generate_character_dialogue(char1, char2)
 
@@ -93,11 +107,8 @@ def create_ai_blueprint(
         """Evaluate factual consistency of generated text."""
         data = request.get_json()
 
-        required_fields = ['generated_text', 'source_data']
-        if not all(field in data for field in required_fields):
-            raise ValidationError(
-                f"Missing required fields: {', '.join(required_fields)}"
-            )
+        if not _FACTUAL_REQUIRED.issubset(data):
+            raise ValidationError(_FACTUAL_ERROR)
 
         evaluation = gemini_service.evaluate_factual_consistency(
             data['generated_text'],
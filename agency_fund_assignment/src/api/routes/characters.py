@@ -1,9 +1,10 @@
 """Character routes."""
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, request
 from src.services import RickMortyService
 from src.repositories import NoteRepository
 from src.utils import ValidationError
+from src.api.serialization import json_response
 
 
 def create_characters_blueprint(
@@ -28,28 +29,39 @@ def create_characters_blueprint(
         character = rick_morty_service.get_character(character_id)
         notes = note_repo.get_by_character_id(character_id)
 
-        return jsonify({
+        return json_response({
             'success': True,
             'data': {
-                'character': character.to_dict(),
-                'notes': [note.to_dict() for note in notes]
+                'character': character,
+                'notes': notes
             }
         })
 
     @bp.route('/search', methods=['GET'])
     def search_characters():
-        """Search characters by name."""
+        """Search characters by name, optionally with their notes."""
         name = request.args.get('name', '')
+        include_notes = request.args.get('include_notes', 'false').lower() == 'true'
 
         if not name:
             raise ValidationError("Name parameter is required")
 
         characters = rick_morty_service.search_characters(name)
 
-        return jsonify({
+        if include_notes:
+            # One query for all matched characters instead of one per character
+            notes = note_repo.get_by_character_ids(char.id for char in characters)
+            data = [
+                {**char.to_dict(), 'notes': notes[char.id]}
+                for char in characters
+            ]
+        else:
+            data = characters
+
+        return json_response({
             'success': True,
             'count': len(characters),
-            'data': [char.to_dict() for char in characters]
+            'data': data
         })
 
     return bp
@@ -1,45 +1,122 @@
 """Location routes."""
 
-from flask import Blueprint, jsonify, request
+import threading
+import time
+from typing import Optional
+
+from flask import Blueprint, current_app, request
 from src.services import RickMortyService
+from src.api.serialization import dumps, json_response, stream_json_list
+from src.utils import AppException
+
+# Longest wait before retrying a rebuild that failed upstream
+_RETRY_SECONDS = 60
+
+
+class _LocationsPayload:
+    """Pre-serialized body of `GET /api/locations`, rebuilt after a TTL."""
+
+    def __init__(self, rick_morty_service: RickMortyService, ttl_seconds: int):
+        """
+        Initialize payload cache.
+
+        Args:
+            rick_morty_service: Rick & Morty service instance
+            ttl_seconds: Seconds before the payload is rebuilt
+        """
+        self._service = rick_morty_service
+        self._ttl_seconds = ttl_seconds
+        self._body: Optional[bytes] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> bytes:
+        """
+        Get the response body, rebuilding it if missing or expired.
+
+        A stale body is served if rebuilding fails upstream, and the
+        rebuild is retried after at most a minute.
 
+        Returns:
+            Encoded JSON response body
+        """
+        if self._body is not None and time.monotonic() < self._expires_at:
+            return self._body
 
-def create_locations_blueprint(rick_morty_service: RickMortyService) -> Blueprint:
+        with self._lock:
+            if self._body is None or time.monotonic() >= self._expires_at:
+                try:
+                    locations = self._service.get_all_locations()
+                except AppException:
+                    if self._body is None:
+                        raise
+                    # Keep serving the stale body lock-free until the next
+                    # retry instead of every request waiting on the outage
+                    self._expires_at = time.monotonic() + min(self._ttl_seconds, _RETRY_SECONDS)
+                    return self._body
+
+                self._body = dumps({
+                    'success': True,
+                    'count': len(locations),
+                    'data': locations
+                })
+                self._expires_at = time.monotonic() + self._ttl_seconds
+
+        return self._body
+
+    def warm(self) -> None:
+        """Build the payload ahead of the first request."""
+        try:
+            self.get()
+        except AppException as e:
+            print(f"Warning: could not prefetch locations: {e}")
+
+
+def create_locations_blueprint(
+    rick_morty_service: RickMortyService,
+    cache_ttl_minutes: int = 60
+) -> Blueprint:
     """
     Create locations blueprint.
 
     Args:
         rick_morty_service: Rick & Morty service instance
+        cache_ttl_minutes: How long the pre-serialized location list is reused
 
     Returns:
         Blueprint for location routes
     """
     bp = Blueprint('locations', __name__, url_prefix='/api/locations')
 
+    locations_payload = _LocationsPayload(rick_morty_service, cache_ttl_minutes * 60)
+    # Servers opt in to warming it through start_prefetch
+    bp.record_once(
+        lambda state: state.app.extensions.setdefault('prefetch', []).append(locations_payload.warm)
+    )
+
     @bp.route('', methods=['GET'])
     def get_locations():
         """Get all locations with optional resident details."""
         include_residents = request.args.get('include_residents', 'false').lower() == 'true'
 
-        if include_residents:
-            locations = rick_morty_service.get_all_locations_with_residents()
-        else:
-            locations = rick_morty_service.get_all_locations()
+        if not include_residents:
+            return current_app.response_class(
+                locations_payload.get(),
+                mimetype='application/json'
+            )
 
-        return jsonify({
-            'success': True,
-            'count': len(locations),
-            'data': [loc.to_dict(include_residents) for loc in locations]
-        })
+        # Nested residents make this payload large, so it is streamed
+        locations = rick_morty_service.get_all_locations_with_residents()
+        return stream_json_list(locations)
 
     @bp.route('/<int:location_id>', methods=['GET'])
     def get_location(location_id: int):
         """Get specific location with resident details."""
         location = rick_morty_service.get_location_with_residents(location_id)
 
-        return jsonify({
+        return json_response({
             'success': True,
-            'data': location.to_dict(include_residents=True)
+            'data': location
         })
 
     return bp
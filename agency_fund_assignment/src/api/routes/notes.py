@@ -4,6 +4,10 @@ from flask import Blueprint, jsonify, request
 from src.repositories import NoteRepository
 from src.utils import ValidationError
 
+_NOTE_REQUIRED = frozenset({'character_id', 'character_name', 'note'})
+_NOTE_FIELDS = "character_id, character_name, note"
+_NOTE_ERROR = f"Missing required fields: {_NOTE_FIELDS}"
+
 
 def create_notes_blueprint(note_repo: NoteRepository) -> Blueprint:
     """
@@ -22,11 +26,8 @@ def create_notes_blueprint(note_repo: NoteRepository) -> Blueprint:
         """Add a note for a character."""
         data = request.get_json()
 
-        required_fields = ['character_id', 'character_name', 'note']
-        if not all(field in data for field in required_fields):
-            raise ValidationError(
-                f"Missing required fields: {', '.join(required_fields)}"
-            )
+        if not _NOTE_REQUIRED.issubset(data):
+            raise ValidationError(_NOTE_ERROR)
 
         note_id = note_repo.create(
             data['character_id'],
@@ -39,6 +40,29 @@ def create_notes_blueprint(note_repo: NoteRepository) -> Blueprint:
             'note_id': note_id
         }), 201
 
+    @bp.route('/bulk', methods=['POST'])
+    def add_notes_bulk():
+        """Add several notes in one request."""
+        data = request.get_json()
+
+        if not isinstance(data, list) or not data:
+            raise ValidationError("Request body must be a non-empty list of notes")
+
+        rows = []
+        for index, item in enumerate(data):
+            if not isinstance(item, dict) or not _NOTE_REQUIRED.issubset(item):
+                raise ValidationError(
+                    f"Note at index {index} is missing required fields: {_NOTE_FIELDS}"
+                )
+            rows.append((item['character_id'], item['character_name'], item['note']))
+
+        count = note_repo.create_many(rows)
+
+        return jsonify({
+            'success': True,
+            'count': count
+        }), 201
+
     @bp.route('/<int:character_id>', methods=['GET'])
     def get_notes(character_id: int):
         """Get all notes for a character."""
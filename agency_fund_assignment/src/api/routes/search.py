@@ -1,11 +1,15 @@
 """Semantic search routes."""
 
+from typing import TYPE_CHECKING
+
 from flask import Blueprint, jsonify, request
-from src.services import SearchService
 from src.utils import ValidationError
 
+if TYPE_CHECKING:
+    from src.services import SearchService
+
 
-def create_search_blueprint(search_service: SearchService) -> Blueprint:
+def create_search_blueprint(search_service: "SearchService") -> Blueprint:
     """
     Create semantic search blueprint.
 
@@ -0,0 +1,103 @@
+"""JSON serialization for API responses."""
+
+from typing import Any, Iterator, Sequence
+
+import orjson
+from flask import Response, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+# Dataclasses go through `_default` so their `to_dict` shape is used
+_DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize model instances through their `to_dict` method."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+    return to_dict()
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize a payload to JSON bytes.
+
+    Args:
+        payload: JSON-compatible data, may contain model instances
+
+    Returns:
+        Encoded JSON
+    """
+    return orjson.dumps(payload, default=_default, option=_DUMPS_OPTIONS)
+
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Build a JSON response without an intermediate `to_dict` pass.
+
+    Args:
+        payload: JSON-compatible data, may contain model instances
+        status: HTTP status code
+
+    Returns:
+        Flask response
+    """
+    return current_app.response_class(
+        dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+def _iter_list_body(items: Sequence[Any]) -> Iterator[bytes]:
+    """Yield a `{success, count, data}` envelope one list item at a time."""
+    yield b'{"success":true,"count":%d,"data":[' % len(items)
+    separator = b''
+    for item in items:
+        yield separator + dumps(item)
+        separator = b','
+    yield b']}'
+
+
+def stream_json_list(items: Sequence[Any]) -> Response:
+    """
+    Build a streamed `{success, count, data}` JSON response.
+
+    Items are encoded as the body is sent, so the full payload is never
+    held in memory and the client can start reading straight away.
+
+    Args:
+        items: List items, may contain model instances
+
+    Returns:
+        Streaming Flask response
+    """
+    return current_app.response_class(
+        stream_with_context(_iter_list_body(items)),
+        mimetype='application/json'
+    )
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Output is compact and keys keep their insertion order, so `jsonify`
+    does no key sort or pretty-printing pass.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response without decoding to str first."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
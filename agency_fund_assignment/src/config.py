@@ -1,7 +1,6 @@
 """Application configuration management."""
 
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import os
@@ -11,12 +10,45 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass(frozen=True)
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+_JOURNAL_MODES = ("WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF")
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration."""
 
     path: str = "rick_and_morty.db"
     test_path: str = "test_rick_and_morty.db"
+    # NORMAL is durable across app crashes in WAL mode; use FULL to also
+    # survive power loss
+    synchronous: str = "NORMAL"
+    # WAL needs shared memory, so use DELETE on network filesystems (NFS)
+    journal_mode: str = "WAL"
+    cache_size_kib: int = 65536
+
+    @classmethod
+    def from_env(cls) -> "DatabaseConfig":
+        """
+        Create configuration from environment variables.
+
+        Raises:
+            ValueError: If DB_SYNCHRONOUS or DB_JOURNAL_MODE is not a
+                SQLite mode name
+        """
+        synchronous = os.getenv("DB_SYNCHRONOUS", "NORMAL").upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"DB_SYNCHRONOUS must be one of {', '.join(_SYNCHRONOUS_MODES)}")
+
+        journal_mode = os.getenv("DB_JOURNAL_MODE", "WAL").upper()
+        if journal_mode not in _JOURNAL_MODES:
+            raise ValueError(f"DB_JOURNAL_MODE must be one of {', '.join(_JOURNAL_MODES)}")
+
+        return cls(
+            synchronous=synchronous,
+            journal_mode=journal_mode,
+            cache_size_kib=int(os.getenv("DB_CACHE_SIZE_KIB", "65536"))
+        )
 
     @property
     def connection_string(self) -> str:
@@ -24,7 +56,7 @@ class DatabaseConfig:
         return self.path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """External API configuration."""
 
@@ -32,9 +64,11 @@ class APIConfig:
     cache_ttl_minutes: int = 60
     request_timeout: int = 10
     max_retries: int = 3
+    # Upstream requests in flight at once, and keep-alive connections held
+    max_connections: int = 8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeminiConfig:
     """Gemini AI configuration."""
 
@@ -43,6 +77,7 @@ class GeminiConfig:
     embedding_model: str = "models/text-embedding-004"
     max_tokens: int = 2048
     temperature: float = 0.7
+    response_cache_ttl_minutes: int = 60
 
     def __post_init__(self):
         """Load API key from environment."""
@@ -55,7 +90,7 @@ class GeminiConfig:
         return self.api_key is not None and self.api_key != ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlaskConfig:
     """Flask application configuration."""
 
@@ -77,7 +112,7 @@ class FlaskConfig:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main application configuration."""
 
@@ -92,7 +127,9 @@ class Config:
         return Path(__file__).parent.parent
 
 
-@lru_cache(maxsize=1)
+_CONFIG: Optional[Config] = None
+
+
 def get_config() -> Config:
     """
     Get application configuration (singleton).
@@ -100,9 +137,12 @@ def get_config() -> Config:
     Returns:
         Config: Application configuration instance
     """
-    return Config(
-        database=DatabaseConfig(),
-        api=APIConfig(),
-        gemini=GeminiConfig(),
-        flask=FlaskConfig.from_env()
-    )
+    global _CONFIG
+    if _CONFIG is None:
+        _CONFIG = Config(
+            database=DatabaseConfig.from_env(),
+            api=APIConfig(),
+            gemini=GeminiConfig(),
+            flask=FlaskConfig.from_env()
+        )
+    return _CONFIG
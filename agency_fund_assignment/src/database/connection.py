@@ -1,29 +1,114 @@
 """Database connection management."""
 
+import atexit
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Generator, Optional
+from queue import Empty, Full, LifoQueue
+from typing import Generator, List, Optional
 from functools import lru_cache
 
 from src.config import get_config
 
+# Per-connection settings, applied once when a pooled connection is opened.
+# Durability and page cache size come from DatabaseConfig; the journal
+# mode is a property of the database file and is set by init_database.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Prepared statements kept per connection; the repositories use a fixed
+# set of SQL strings, plus one IN/VALUES variant per batch size
+_CACHED_STATEMENTS = 256
+
 
 class DatabaseConnection:
-    """Database connection manager."""
+    """
+    Database connection manager.
+
+    Keeps a small pool of persistent SQLite connections instead of opening
+    a new one per query. A thread holds a single connection for the
+    duration of a `get_connection`/`execute` call, so nested calls on the
+    same thread share one handle and one transaction.
+    """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, pool_size: int = 8):
         """
         Initialize database connection.
 
         Args:
             db_path: Optional custom database path
+            pool_size: Maximum number of idle connections kept open
         """
-        self.db_path = db_path or get_config().database.path
+        config = get_config().database
+        self.db_path = db_path or config.path
+        self.journal_mode = config.journal_mode
+        self.pool_size = pool_size
+        self._pragmas = (
+            f"PRAGMA synchronous={config.synchronous}",
+            f"PRAGMA cache_size=-{config.cache_size_kib}",
+        ) + _CONNECTION_PRAGMAS
+        self._idle: LifoQueue = LifoQueue(maxsize=pool_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new pooled connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self._pragmas:
+            conn.execute(pragma)
+
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        if conn.in_transaction:
+            conn.rollback()
+
+        try:
+            self._idle.put_nowait(conn)
+        except Full:
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            conn.close()
+
+    @contextmanager
+    def _checkout(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a connection for the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            # Nested use on the same thread shares the outer handle
+            yield conn
+            return
+
+        try:
+            conn = self._idle.get_nowait()
+        except Empty:
+            conn = self._connect()
+
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
-        Context manager for database connections.
+        Context manager for a transactional database connection.
 
         Yields:
             sqlite3.Connection: Database connection
@@ -33,47 +118,70 @@ class DatabaseConnection:
                 cursor = conn.cursor()
                 cursor.execute("SELECT * FROM notes")
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        with self._checkout() as conn:
+            if conn.in_transaction:
+                # Join the enclosing transaction on this thread
+                yield conn
+                return
+
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
     def execute(
         self,
         query: str,
         params: tuple = (),
         fetch_one: bool = False,
-        fetch_all: bool = False
+        fetch_all: bool = False,
+        return_rowcount: bool = False
     ):
         """
         Execute a query with automatic connection management.
 
+        Single statements run in autocommit mode on a pooled connection,
+        so no explicit transaction is opened for them.
+
         Args:
             query: SQL query to execute
             params: Query parameters
             fetch_one: Return single row
             fetch_all: Return all rows
+            return_rowcount: Return the number of rows changed
 
         Returns:
-            Query result or None
+            Query result, row count, or last inserted row ID
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
+        with self._checkout() as conn:
+            cursor = conn.execute(query, params)
 
             if fetch_one:
                 return cursor.fetchone()
             if fetch_all:
                 return cursor.fetchall()
+            if return_rowcount:
+                return cursor.rowcount
 
             return cursor.lastrowid
 
+    def close_all(self) -> None:
+        """Close every pooled connection (call on shutdown)."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        while True:
+            try:
+                self._idle.get_nowait()
+            except Empty:
+                break
+
+        for conn in connections:
+            conn.close()
+
 
 @lru_cache(maxsize=1)
 def get_db_connection(db_path: Optional[str] = None) -> DatabaseConnection:
@@ -86,4 +194,6 @@ def get_db_connection(db_path: Optional[str] = None) -> DatabaseConnection:
     Returns:
         DatabaseConnection instance
     """
-    return DatabaseConnection(db_path)
+    db = DatabaseConnection(db_path)
+    atexit.register(db.close_all)
+    return db
@@ -85,25 +85,228 @@ class CreateCharacterEmbeddingsTable(Migration):
         ]
 
 
+class CreateLookupIndexes(Migration):
+    """Create indexes for cache expiry checks and embedding name lookups."""
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            """
+            CREATE INDEX IF NOT EXISTS idx_api_cache_key_expires
+            ON api_cache(cache_key, expires_at)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_character_embeddings_name
+            ON character_embeddings(character_name)
+            """
+        ]
+
+
+class StoreEmbeddingsAsBlob(Migration):
+    """
+    Store embeddings as raw float32 BLOBs instead of JSON text.
+
+    Embeddings are derived data, so existing rows are dropped rather than
+    converted; re-run character indexing after upgrading.
+    """
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            "DROP TABLE IF EXISTS character_embeddings",
+            """
+            CREATE TABLE character_embeddings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                character_id INTEGER UNIQUE NOT NULL,
+                character_name TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                metadata TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_character_embeddings_character_id
+            ON character_embeddings(character_id)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_character_embeddings_name
+            ON character_embeddings(character_name)
+            """
+        ]
+
+
+class QuantizeEmbeddings(Migration):
+    """
+    Store embeddings as int8 with a per-vector float scale.
+
+    Existing float32 rows cannot be read in the new format and are
+    cleared; re-run character indexing after upgrading.
+    """
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            "DELETE FROM character_embeddings",
+            """
+            ALTER TABLE character_embeddings
+            ADD COLUMN scale REAL NOT NULL DEFAULT 1.0
+            """
+        ]
+
+
+class StoreTimestampsAsEpoch(Migration):
+    """
+    Store note and cache timestamps as INTEGER unix seconds.
+
+    Integers bind and compare without sqlite3's datetime adapter. Notes
+    are rebuilt with their existing timestamps converted; cached API
+    responses are derived data and are dropped.
+    """
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            """
+            CREATE TABLE character_notes_new (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                character_id INTEGER NOT NULL,
+                character_name TEXT NOT NULL,
+                note TEXT NOT NULL,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                updated_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            )
+            """,
+            """
+            INSERT INTO character_notes_new
+            (id, character_id, character_name, note, created_at, updated_at)
+            SELECT
+                id, character_id, character_name, note,
+                COALESCE(CAST(strftime('%s', created_at) AS INTEGER), CAST(strftime('%s', 'now') AS INTEGER)),
+                COALESCE(
+                    CASE
+                        -- Edits stored datetime.now(), local time with microseconds;
+                        -- untouched rows still hold the UTC CURRENT_TIMESTAMP default
+                        WHEN updated_at LIKE '%.%' THEN CAST(strftime('%s', updated_at, 'utc') AS INTEGER)
+                        ELSE CAST(strftime('%s', updated_at) AS INTEGER)
+                    END,
+                    CAST(strftime('%s', 'now') AS INTEGER)
+                )
+            FROM character_notes
+            """,
+            "DROP TABLE character_notes",
+            "ALTER TABLE character_notes_new RENAME TO character_notes",
+            """
+            CREATE INDEX IF NOT EXISTS idx_character_notes_character_id
+            ON character_notes(character_id)
+            """,
+            "DROP TABLE IF EXISTS api_cache",
+            """
+            CREATE TABLE api_cache (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cache_key TEXT UNIQUE NOT NULL,
+                data TEXT NOT NULL,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                expires_at INTEGER
+            )
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_api_cache_expires
+            ON api_cache(expires_at)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_api_cache_key_expires
+            ON api_cache(cache_key, expires_at)
+            """
+        ]
+
+
+class CreateListingIndexes(Migration):
+    """
+    Index notes in listing order and drop indexes duplicated by UNIQUE.
+
+    Note listings filter on character_id and sort by created_at DESC,
+    which the composite index serves in order without a sort step. The
+    UNIQUE constraints on api_cache.cache_key and
+    character_embeddings.character_id already create indexes that the
+    planner prefers for equality lookups, so the duplicates only add
+    write cost.
+    """
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            """
+            CREATE INDEX IF NOT EXISTS idx_character_notes_character_created
+            ON character_notes(character_id, created_at DESC)
+            """,
+            "DROP INDEX IF EXISTS idx_character_notes_character_id",
+            "DROP INDEX IF EXISTS idx_api_cache_key",
+            "DROP INDEX IF EXISTS idx_api_cache_key_expires",
+            "DROP INDEX IF EXISTS idx_character_embeddings_character_id"
+        ]
+
+
+class CreateEmbeddingCacheTable(Migration):
+    """
+    Create embedding_cache table.
+
+    Keyed by a SHA-256 digest of the embedded text plus model and task
+    type; the composite primary key is the only lookup, so the table is
+    stored WITHOUT ROWID.
+    """
+
+    @staticmethod
+    def get_statements() -> List[str]:
+        return [
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                text_hash BLOB NOT NULL,
+                model TEXT NOT NULL,
+                task_type TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                PRIMARY KEY (text_hash, model, task_type)
+            ) WITHOUT ROWID
+            """
+        ]
+
+
+# Applied in order; append new migrations, never reorder or remove them
+MIGRATIONS = [
+    CreateCharacterNotesTable,
+    CreateAPICacheTable,
+    CreateCharacterEmbeddingsTable,
+    CreateLookupIndexes,
+    StoreEmbeddingsAsBlob,
+    QuantizeEmbeddings,
+    StoreTimestampsAsEpoch,
+    CreateListingIndexes,
+    CreateEmbeddingCacheTable
+]
+
+
 def init_database(db: DatabaseConnection) -> None:
     """
-    Initialize database with all migrations.
+    Initialize database by applying pending migrations.
+
+    The number of applied migrations is tracked in `PRAGMA user_version`,
+    so each migration runs once per database.
 
     Args:
         db: DatabaseConnection instance
     """
-    migrations = [
-        CreateCharacterNotesTable,
-        CreateAPICacheTable,
-        CreateCharacterEmbeddingsTable
-    ]
+    # The journal mode persists in the database file; it must be set
+    # outside a transaction
+    db.execute(f"PRAGMA journal_mode={db.journal_mode}")
 
     with db.get_connection() as conn:
         cursor = conn.cursor()
+        applied = cursor.execute("PRAGMA user_version").fetchone()[0]
 
-        for migration_class in migrations:
+        for migration_class in MIGRATIONS[applied:]:
             migration = migration_class()
             for statement in migration.get_statements():
                 cursor.execute(statement)
 
-        conn.commit()
+        if applied < len(MIGRATIONS):
+            cursor.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
@@ -1,15 +1,26 @@
 """Character data models."""
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+# Recently built characters keyed by id. Each entry keeps the source dict
+# so a changed upstream payload is rebuilt instead of served stale.
+_CHARACTER_CACHE_SIZE = 2048
+_character_cache: "OrderedDict[int, Tuple[Dict[str, Any], Character]]" = OrderedDict()
+_character_cache_lock = threading.Lock()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CharacterOrigin:
     """Character origin information."""
 
     name: str
     url: str
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CharacterOrigin":
@@ -19,13 +30,25 @@ class CharacterOrigin:
             url=data.get("url", "")
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (built once, do not mutate)."""
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", {
+                "name": self.name,
+                "url": self.url
+            })
+        return self._dict_cache
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CharacterLocation:
     """Character location information."""
 
     name: str
     url: str
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CharacterLocation":
@@ -35,8 +58,17 @@ class CharacterLocation:
             url=data.get("url", "")
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (built once, do not mutate)."""
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", {
+                "name": self.name,
+                "url": self.url
+            })
+        return self._dict_cache
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Character:
     """Character data model."""
 
@@ -52,6 +84,12 @@ class Character:
     episode: List[str] = field(default_factory=list)
     url: str = ""
     created: str = ""
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _description: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Character":
@@ -64,6 +102,25 @@ class Character:
         Returns:
             Character instance
         """
+        character_id = data["id"]
+        with _character_cache_lock:
+            entry = _character_cache.get(character_id)
+            if entry is not None and entry[0] == data:
+                _character_cache.move_to_end(character_id)
+                return entry[1]
+
+        character = cls._build(data)
+
+        with _character_cache_lock:
+            _character_cache[character_id] = (data, character)
+            _character_cache.move_to_end(character_id)
+            if len(_character_cache) > _CHARACTER_CACHE_SIZE:
+                _character_cache.popitem(last=False)
+        return character
+
+    @classmethod
+    def _build(cls, data: Dict[str, Any]) -> "Character":
+        """Construct a Character without consulting the cache."""
         return cls(
             id=data["id"],
             name=data["name"],
@@ -80,43 +137,39 @@ class Character:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "status": self.status,
-            "species": self.species,
-            "type": self.type,
-            "gender": self.gender,
-            "origin": {
-                "name": self.origin.name,
-                "url": self.origin.url
-            },
-            "location": {
-                "name": self.location.name,
-                "url": self.location.url
-            },
-            "image": self.image,
-            "episode": self.episode,
-            "url": self.url,
-            "created": self.created
-        }
+        """
+        Convert to dictionary.
+
+        The instance is immutable, so the dictionary is built once and
+        reused on later calls. Callers must not mutate the result.
+        """
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", {
+                "id": self.id,
+                "name": self.name,
+                "status": self.status,
+                "species": self.species,
+                "type": self.type,
+                "gender": self.gender,
+                "origin": self.origin.to_dict(),
+                "location": self.location.to_dict(),
+                "image": self.image,
+                "episode": self.episode,
+                "url": self.url,
+                "created": self.created
+            })
+        return self._dict_cache
 
     def get_description(self) -> str:
         """Get comprehensive description for embedding generation."""
-        parts = [
-            f"Name: {self.name}",
-            f"Status: {self.status}",
-            f"Species: {self.species}",
-        ]
-
-        if self.type:
-            parts.append(f"Type: {self.type}")
-
-        parts.extend([
-            f"Gender: {self.gender}",
-            f"Origin: {self.origin.name}",
-            f"Current Location: {self.location.name}",
-        ])
-
-        return ". ".join(parts)
+        if self._description is None:
+            type_part = f". Type: {self.type}" if self.type else ""
+            object.__setattr__(
+                self,
+                "_description",
+                f"Name: {self.name}. Status: {self.status}. "
+                f"Species: {self.species}{type_part}. "
+                f"Gender: {self.gender}. Origin: {self.origin.name}. "
+                f"Current Location: {self.location.name}"
+            )
+        return self._description
@@ -1,11 +1,11 @@
 """Location data models."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Any, Optional
 from .character import Character
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Location:
     """Location data model."""
 
@@ -17,6 +17,12 @@ class Location:
     url: str = ""
     created: str = ""
     residents_details: Optional[List[Character]] = None
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _full_dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any], residents_details: Optional[List[Character]] = None) -> "Location":
@@ -41,32 +47,59 @@ class Location:
             residents_details=residents_details
         )
 
+    def with_residents(self, residents_details: List[Character]) -> "Location":
+        """
+        Get a copy of this location with resident details attached.
+
+        Args:
+            residents_details: List of character details
+
+        Returns:
+            Location instance
+        """
+        return replace(self, residents_details=residents_details)
+
     def to_dict(self, include_residents: bool = True) -> Dict[str, Any]:
         """
         Convert to dictionary.
 
+        Both variants are built once per instance and reused on later
+        calls. Callers must not mutate the result.
+
         Args:
             include_residents: Whether to include resident details
 
         Returns:
             Dictionary representation
         """
-        result = {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type,
-            "dimension": self.dimension,
-            "residents": self.residents,
-            "url": self.url,
-            "created": self.created
-        }
-
         if include_residents and self.residents_details is not None:
-            result["residents_details"] = [
-                char.to_dict() for char in self.residents_details
-            ]
+            return self._to_full_dict()
+        return self._to_base_dict()
+
+    def _to_base_dict(self) -> Dict[str, Any]:
+        """Get the dictionary without resident details."""
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", {
+                "id": self.id,
+                "name": self.name,
+                "type": self.type,
+                "dimension": self.dimension,
+                "residents": self.residents,
+                "url": self.url,
+                "created": self.created
+            })
+        return self._dict_cache
 
-        return result
+    def _to_full_dict(self) -> Dict[str, Any]:
+        """Get the dictionary including resident details."""
+        if self._full_dict_cache is None:
+            object.__setattr__(self, "_full_dict_cache", {
+                **self._to_base_dict(),
+                "residents_details": [
+                    char.to_dict() for char in self.residents_details
+                ]
+            })
+        return self._full_dict_cache
 
     @property
     def resident_count(self) -> int:
@@ -1,11 +1,11 @@
 """Note data models."""
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, Sequence, Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Note:
     """Character note data model."""
 
@@ -36,14 +36,41 @@ class Note:
             updated_at=cls._parse_datetime(data.get("updated_at"))
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "Note":
+        """
+        Create Note from a database row.
+
+        Args:
+            row: Row with columns (id, character_id, character_name, note,
+                created_at, updated_at), in that order
+
+        Returns:
+            Note instance
+        """
+        note_id, character_id, character_name, note, created_at, updated_at = row
+        return cls(
+            id=note_id,
+            character_id=character_id,
+            character_name=character_name,
+            note=note,
+            created_at=cls._parse_datetime(created_at),
+            updated_at=cls._parse_datetime(updated_at)
+        )
+
     @staticmethod
-    def _parse_datetime(dt_str: Optional[str]) -> datetime:
-        """Parse datetime string."""
-        if not dt_str:
+    def _parse_datetime(value: Union[int, str, None]) -> datetime:
+        """Parse a unix timestamp (as stored in SQLite) or ISO datetime string."""
+        if not value:
             return datetime.now()
 
+        if isinstance(value, int):
+            # Stored timestamps are UTC; keep them naive like the ISO values
+            return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
         try:
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+            # fromisoformat accepts a trailing 'Z' directly (Python 3.11+)
+            return datetime.fromisoformat(value)
         except (ValueError, AttributeError):
             return datetime.now()
 
@@ -2,10 +2,30 @@
 
 from .note_repository import NoteRepository
 from .cache_repository import CacheRepository
-from .embedding_repository import EmbeddingRepository
+from .embedding_cache_repository import EmbeddingCacheRepository
+
+# The embedding repository depends on numpy; load it on first access
+_LAZY_IMPORTS = {
+    "EmbeddingRepository": ".embedding_repository",
+    "EmbeddingIndex": ".embedding_repository",
+    "EmbeddingQuantizer": ".embedding_repository",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "NoteRepository",
     "CacheRepository",
-    "EmbeddingRepository"
+    "EmbeddingCacheRepository",
+    "EmbeddingRepository",
+    "EmbeddingIndex",
+    "EmbeddingQuantizer"
 ]
@@ -1,8 +1,17 @@
 """Base repository class."""
 
+import sqlite3
 from abc import ABC
+from typing import Sequence
+
 from src.database.connection import DatabaseConnection
 
+# SQLite's default bound-parameter limit on older builds
+_MAX_BIND_PARAMS = 999
+
+# Chunk size for `IN (...)` lookups, kept well below the limit
+_MAX_IN_PARAMS = 900
+
 
 class BaseRepository(ABC):
     """Base class for all repositories."""
@@ -15,3 +24,36 @@ class BaseRepository(ABC):
             db: DatabaseConnection instance
         """
         self.db = db
+
+    @staticmethod
+    def _insert_rows(
+        conn: sqlite3.Connection,
+        statement: str,
+        rows: Sequence[Sequence],
+        width: int
+    ) -> int:
+        """
+        Insert rows with multi-row VALUES statements.
+
+        Rows are split into chunks so no statement binds more than
+        SQLite's parameter limit.
+
+        Args:
+            conn: Connection with an open transaction
+            statement: INSERT statement up to, but excluding, VALUES
+            rows: Row tuples, each with `width` values
+            width: Number of columns per row
+
+        Returns:
+            Number of rows inserted
+        """
+        chunk_size = _MAX_BIND_PARAMS // width
+        placeholder = "(" + ", ".join("?" * width) + ")"
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            conn.execute(
+                f"{statement} VALUES {', '.join([placeholder] * len(chunk))}",
+                [value for row in chunk for value in row]
+            )
+        return len(rows)
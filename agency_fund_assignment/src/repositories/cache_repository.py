@@ -1,15 +1,77 @@
 """Cache repository for API response caching."""
 
-import json
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
+import orjson
+
+from src.database.connection import DatabaseConnection
 from src.utils import DatabaseError
-from .base import BaseRepository
+from .base import BaseRepository, _MAX_IN_PARAMS
+
+# Number of decoded payloads kept in process memory
+_MEMORY_CACHE_SIZE = 1024
+
+_SQL_GET = """
+    SELECT data, expires_at FROM api_cache
+    WHERE cache_key = ?
+    AND (expires_at IS NULL OR expires_at > ?)
+"""
+_SQL_GET_RAW = """
+    SELECT data FROM api_cache
+    WHERE cache_key = ?
+    AND (expires_at IS NULL OR expires_at > ?)
+"""
+_SQL_HEAD = """
+    SELECT EXISTS(
+        SELECT 1 FROM api_cache
+        WHERE cache_key = ?
+        AND (expires_at IS NULL OR expires_at > ?)
+    )
+"""
+_SQL_INSERT = "INSERT OR REPLACE INTO api_cache (cache_key, data, expires_at)"
+_SQL_DELETE = "DELETE FROM api_cache WHERE cache_key = ?"
+_SQL_CLEAR_EXPIRED = """
+    DELETE FROM api_cache
+    WHERE expires_at IS NOT NULL AND expires_at < ?
+"""
+_SQL_CLEAR_ALL = "DELETE FROM api_cache"
 
 
 class CacheRepository(BaseRepository):
-    """Repository for caching API responses."""
+    """
+    Repository for caching API responses.
+
+    Payloads are stored as orjson-encoded bytes and decoded straight from
+    the row value. Expiry times are unix seconds.
+
+    Recently read or written payloads are also kept decoded in a small
+    per-process LRU, each with the expiry of its SQLite row, so hot keys
+    skip the query and the decode. Returned payloads are shared and must
+    not be mutated.
+    """
+
+    def __init__(self, db: DatabaseConnection):
+        """
+        Initialize repository.
+
+        Args:
+            db: DatabaseConnection instance
+        """
+        super().__init__(db)
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+    def _remember(self, cache_key: str, expires_at: Optional[int], data: Dict[str, Any]) -> None:
+        """Store a decoded payload in the in-process LRU."""
+        expiry = float('inf') if expires_at is None else expires_at
+        with self._memory_lock:
+            self._memory[cache_key] = (expiry, data)
+            self._memory.move_to_end(cache_key)
+            if len(self._memory) > _MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
 
     def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -21,26 +83,128 @@ class CacheRepository(BaseRepository):
         Returns:
             Cached data if found and not expired, None otherwise
         """
+        now = int(time.time())
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(cache_key)
+                    return entry[1]
+                del self._memory[cache_key]
+
         try:
-            query = """
-                SELECT data FROM api_cache
-                WHERE cache_key = ?
-                AND (expires_at IS NULL OR expires_at > ?)
-            """
             row = self.db.execute(
-                query,
-                (cache_key, datetime.now()),
+                _SQL_GET,
+                (cache_key, now),
                 fetch_one=True
             )
 
             if row:
-                return json.loads(row['data'])
+                data = orjson.loads(row['data'])
+                self._remember(cache_key, row['expires_at'], data)
+                return data
             return None
         except Exception as e:
             # Don't raise error for cache misses
             print(f"Cache fetch error: {e}")
             return None
 
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached data for several keys.
+
+        Keys held in the in-process LRU are served from it; the rest are
+        read with one query per chunk of keys.
+
+        Args:
+            cache_keys: Cache keys
+
+        Returns:
+            Dictionary mapping each key found and not expired to its data
+        """
+        now = int(time.time())
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+
+        with self._memory_lock:
+            for cache_key in dict.fromkeys(cache_keys):
+                entry = self._memory.get(cache_key)
+                if entry is not None and entry[0] > now:
+                    self._memory.move_to_end(cache_key)
+                    found[cache_key] = entry[1]
+                else:
+                    missing.append(cache_key)
+
+        try:
+            for i in range(0, len(missing), _MAX_IN_PARAMS):
+                chunk = missing[i:i + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                    SELECT cache_key, data, expires_at FROM api_cache
+                    WHERE cache_key IN ({placeholders})
+                    AND (expires_at IS NULL OR expires_at > ?)
+                """
+                rows = self.db.execute(query, (*chunk, now), fetch_all=True)
+
+                for row in rows or []:
+                    data = orjson.loads(row['data'])
+                    self._remember(row['cache_key'], row['expires_at'], data)
+                    found[row['cache_key']] = data
+        except Exception as e:
+            # Don't raise error for cache misses
+            print(f"Cache fetch error: {e}")
+
+        return found
+
+    def get_raw(self, cache_key: str) -> Optional[bytes]:
+        """
+        Get the stored JSON payload without decoding it.
+
+        Useful when the payload is forwarded as-is, e.g. as a response body.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Encoded JSON if found and not expired, None otherwise
+        """
+        try:
+            row = self.db.execute(
+                _SQL_GET_RAW,
+                (cache_key, int(time.time())),
+                fetch_one=True
+            )
+            if row is None:
+                return None
+            data = row['data']
+            return data.encode() if isinstance(data, str) else data
+        except Exception as e:
+            print(f"Cache fetch error: {e}")
+            return None
+
+    def head(self, cache_key: str) -> bool:
+        """
+        Check whether a fresh entry exists without reading its payload.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            True if an unexpired entry exists, False otherwise
+        """
+        now = int(time.time())
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None and entry[0] > now:
+                return True
+
+        try:
+            row = self.db.execute(_SQL_HEAD, (cache_key, now), fetch_one=True)
+            return bool(row[0])
+        except Exception as e:
+            print(f"Cache fetch error: {e}")
+            return False
+
     def set(
         self,
         cache_key: str,
@@ -58,19 +222,50 @@ class CacheRepository(BaseRepository):
         Raises:
             DatabaseError: If cache set fails
         """
+        self.set_many([(cache_key, data)], ttl_minutes=ttl_minutes)
+
+    def set_many(
+        self,
+        entries: Iterable[Tuple[str, Dict[str, Any]]],
+        ttl_minutes: int = 60
+    ) -> int:
+        """
+        Set several cache entries in a single transaction.
+
+        Args:
+            entries: (cache_key, data) pairs
+            ttl_minutes: Time to live in minutes
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            DatabaseError: If cache set fails
+        """
+        entries = list(entries)
         try:
-            expires_at = datetime.now() + timedelta(minutes=ttl_minutes)
-            query = """
-                INSERT OR REPLACE INTO api_cache (cache_key, data, expires_at)
-                VALUES (?, ?, ?)
-            """
-            self.db.execute(
-                query,
-                (cache_key, json.dumps(data), expires_at)
-            )
+            expires_at = int(time.time()) + ttl_minutes * 60
+            values = [
+                (cache_key, orjson.dumps(data), expires_at)
+                for cache_key, data in entries
+            ]
+            if not values:
+                return 0
+
+            with self.db.get_connection() as conn:
+                count = self._insert_rows(
+                    conn,
+                    _SQL_INSERT,
+                    values,
+                    width=3
+                )
         except Exception as e:
             raise DatabaseError(f"Failed to set cache: {str(e)}")
 
+        for cache_key, data in entries:
+            self._remember(cache_key, expires_at, data)
+        return count
+
     def delete(self, cache_key: str) -> bool:
         """
         Delete cached data.
@@ -81,12 +276,11 @@ class CacheRepository(BaseRepository):
         Returns:
             True if deleted, False otherwise
         """
+        with self._memory_lock:
+            self._memory.pop(cache_key, None)
+
         try:
-            query = "DELETE FROM api_cache WHERE cache_key = ?"
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (cache_key,))
-                return cursor.rowcount > 0
+            return self.db.execute(_SQL_DELETE, (cache_key,), return_rowcount=True) > 0
         except Exception as e:
             raise DatabaseError(f"Failed to delete cache: {str(e)}")
 
@@ -97,22 +291,22 @@ class CacheRepository(BaseRepository):
         Returns:
             Number of entries deleted
         """
+        now = int(time.time())
+        with self._memory_lock:
+            for cache_key in [key for key, (expiry, _) in self._memory.items() if expiry <= now]:
+                del self._memory[cache_key]
+
         try:
-            query = """
-                DELETE FROM api_cache
-                WHERE expires_at IS NOT NULL AND expires_at < ?
-            """
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (datetime.now(),))
-                return cursor.rowcount
+            return self.db.execute(_SQL_CLEAR_EXPIRED, (now,), return_rowcount=True)
         except Exception as e:
             raise DatabaseError(f"Failed to clear expired cache: {str(e)}")
 
     def clear_all(self) -> None:
         """Clear all cache entries."""
+        with self._memory_lock:
+            self._memory.clear()
+
         try:
-            query = "DELETE FROM api_cache"
-            self.db.execute(query)
+            self.db.execute(_SQL_CLEAR_ALL)
         except Exception as e:
             raise DatabaseError(f"Failed to clear cache: {str(e)}")
@@ -0,0 +1,102 @@
+"""Embedding cache repository for reusing computed embeddings."""
+
+import hashlib
+from array import array
+from typing import Dict, List, Sequence
+
+from src.utils import DatabaseError
+from .base import BaseRepository, _MAX_IN_PARAMS
+
+_SQL_INSERT = "INSERT OR REPLACE INTO embedding_cache (text_hash, model, task_type, embedding)"
+
+
+class EmbeddingCacheRepository(BaseRepository):
+    """
+    Repository for caching embeddings by the text they were computed from.
+
+    Entries are keyed by the SHA-256 of the text together with the
+    embedding model and task type, since the same text embeds differently
+    under another model or as a query instead of a document. Vectors are
+    stored as raw float32 bytes and never expire, so only document
+    embeddings, bounded by the indexed texts, are written here.
+    """
+
+    @staticmethod
+    def _hash_text(text: str) -> bytes:
+        """Get the cache key digest for a text."""
+        return hashlib.sha256(text.encode()).digest()
+
+    def get_many(
+        self,
+        texts: Sequence[str],
+        model: str,
+        task_type: str
+    ) -> Dict[str, List[float]]:
+        """
+        Get cached embeddings for several texts.
+
+        Lookups are chunked to stay below SQLite's parameter limit.
+
+        Args:
+            texts: Embedded texts
+            model: Embedding model name
+            task_type: Embedding task type
+
+        Returns:
+            Dictionary mapping each cached text to its embedding vector
+        """
+        by_hash = {self._hash_text(text): text for text in texts}
+        hashes = list(by_hash)
+        found = {}
+
+        try:
+            for start in range(0, len(hashes), _MAX_IN_PARAMS):
+                chunk = hashes[start:start + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                    SELECT text_hash, embedding FROM embedding_cache
+                    WHERE model = ? AND task_type = ?
+                    AND text_hash IN ({placeholders})
+                """
+                rows = self.db.execute(query, (model, task_type, *chunk), fetch_all=True)
+
+                for row in rows or []:
+                    found[by_hash[row['text_hash']]] = array('f', row['embedding']).tolist()
+        except Exception as e:
+            # Don't raise error for cache misses
+            print(f"Embedding cache fetch error: {e}")
+
+        return found
+
+    def set_many(
+        self,
+        embeddings: Dict[str, Sequence[float]],
+        model: str,
+        task_type: str
+    ) -> int:
+        """
+        Cache several embeddings in a single transaction.
+
+        Args:
+            embeddings: Dictionary mapping text to its embedding vector
+            model: Embedding model name
+            task_type: Embedding task type
+
+        Returns:
+            Number of embeddings written
+
+        Raises:
+            DatabaseError: If cache set fails
+        """
+        values = [
+            (self._hash_text(text), model, task_type, array('f', embedding).tobytes())
+            for text, embedding in embeddings.items()
+        ]
+        if not values:
+            return 0
+
+        try:
+            with self.db.get_connection() as conn:
+                return self._insert_rows(conn, _SQL_INSERT, values, width=4)
+        except Exception as e:
+            raise DatabaseError(f"Failed to cache embeddings: {str(e)}")
@@ -1,20 +1,157 @@
 """Embedding repository for semantic search."""
 
-import json
-from typing import List, Dict, Any, Optional
+import re
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple
 
+import numpy as np
+import orjson
+
+from src.database.connection import DatabaseConnection
 from src.utils import DatabaseError
-from .base import BaseRepository
+from .base import BaseRepository, _MAX_IN_PARAMS
+
+_SQL_INSERT = """INSERT OR REPLACE INTO character_embeddings
+    (character_id, character_name, embedding, scale, metadata)"""
+_SQL_GET = """
+    SELECT embedding, scale FROM character_embeddings
+    WHERE character_id = ?
+"""
+_SQL_GET_ALL = """
+    SELECT character_id, character_name, embedding, scale, metadata
+    FROM character_embeddings
+"""
+# Metadata keys usable with get_all_with_fields; they double as column aliases
+_FIELD_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+_SQL_INDEX_VERSION = "SELECT COUNT(*), MAX(id) FROM character_embeddings"
+_SQL_INDEX_ROWS = """
+    SELECT character_id, character_name, embedding, scale, metadata
+    FROM character_embeddings
+    ORDER BY id
+"""
+_SQL_EXISTS = """
+    SELECT EXISTS(SELECT 1 FROM character_embeddings WHERE character_id = ?)
+"""
+_SQL_DELETE = "DELETE FROM character_embeddings WHERE character_id = ?"
+_SQL_COUNT = "SELECT COUNT(*) as count FROM character_embeddings"
+
+
+@dataclass(frozen=True, slots=True)
+class EmbeddingIndex:
+    """All stored embeddings in column layout, one row per character."""
+
+    character_ids: np.ndarray
+    character_names: List[str]
+    metadata: List[Optional[Dict[str, Any]]]
+    vectors: np.ndarray
+
+    def __len__(self) -> int:
+        """Get number of indexed characters."""
+        return len(self.character_ids)
+
+    def k_nearest(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank rows by cosine similarity to a query.
+
+        All similarities come from a single matrix-vector product over
+        the normalized rows, and only the top-k are sorted.
+
+        Args:
+            query: Query vector of shape (D,)
+            k: Number of results to return
+
+        Returns:
+            Tuple of (row indices, similarity scores), best first
+        """
+        query = np.asarray(query, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        scores = self.vectors @ query
+
+        k = max(0, min(k, len(scores)))
+        top = np.argpartition(scores, -k)[-k:] if 0 < k < len(scores) else np.arange(k)
+        top = top[np.argsort(scores[top])[::-1]]
+        return top, scores[top]
+
+
+class EmbeddingQuantizer:
+    """
+    Symmetric per-vector int8 quantization of embeddings.
+
+    A vector v is stored as round(v / s) with s = max(|v|) / 127, a
+    quarter of its float32 size. Vectors are L2-normalized first, so
+    cosine similarity reduces to a dot product.
+    """
+
+    @staticmethod
+    def normalize(embedding: Sequence[float]) -> np.ndarray:
+        """Convert an embedding to an L2-normalized float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    @staticmethod
+    def quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Quantize a vector to int8.
+
+        Args:
+            vector: float32 vector
+
+        Returns:
+            (int8 vector, scale) pair
+        """
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127 if peak > 0 else 1.0
+        return np.round(vector / scale).astype(np.int8), scale
+
+    @staticmethod
+    def dequantize(data: bytes, scale: float) -> np.ndarray:
+        """Restore a float32 vector from int8 bytes and its scale."""
+        return np.frombuffer(data, dtype=np.int8).astype(np.float32) * np.float32(scale)
+
+    @staticmethod
+    def dequantize_matrix(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        """
+        Restore an (N, D) int8 matrix to float32 rows of unit length.
+
+        Rows are re-normalized so dot products against them stay exact
+        cosines of the restored vectors.
+        """
+        vectors = quantized.astype(np.float32)
+        vectors *= scales[:, None]
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1)
+        return vectors
 
 
 class EmbeddingRepository(BaseRepository):
-    """Repository for character embeddings."""
+    """
+    Repository for character embeddings.
+
+    Vectors are L2-normalized and stored as int8 bytes with one float
+    scale per row (a quarter of the float32 size). They are dequantized
+    once when the in-memory index is built, so cosine similarity against
+    the index is a plain float32 dot product.
+    """
+
+    def __init__(self, db: DatabaseConnection):
+        """
+        Initialize repository.
+
+        Args:
+            db: DatabaseConnection instance
+        """
+        super().__init__(db)
+        self._index: Optional[Tuple[Tuple[int, Optional[int]], EmbeddingIndex]] = None
 
     def save(
         self,
         character_id: int,
         character_name: str,
-        embedding: List[float],
+        embedding: Sequence[float],
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """
@@ -26,28 +163,54 @@ class EmbeddingRepository(BaseRepository):
             embedding: Embedding vector
             metadata: Optional metadata
 
+        Raises:
+            DatabaseError: If save fails
+        """
+        self.save_many([(character_id, character_name, embedding, metadata)])
+
+    def save_many(
+        self,
+        rows: Iterable[Tuple[int, str, Sequence[float], Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Save several character embeddings in a single transaction.
+
+        Args:
+            rows: (character_id, character_name, embedding, metadata) tuples
+
+        Returns:
+            Number of embeddings saved
+
         Raises:
             DatabaseError: If save fails
         """
         try:
-            query = """
-                INSERT OR REPLACE INTO character_embeddings
-                (character_id, character_name, embedding, metadata)
-                VALUES (?, ?, ?, ?)
-            """
-            self.db.execute(
-                query,
-                (
+            values = []
+            for character_id, character_name, embedding, metadata in rows:
+                quantized, scale = EmbeddingQuantizer.quantize(
+                    EmbeddingQuantizer.normalize(embedding)
+                )
+                values.append((
                     character_id,
                     character_name,
-                    json.dumps(embedding),
-                    json.dumps(metadata) if metadata else None
+                    quantized.tobytes(),
+                    scale,
+                    orjson.dumps(metadata).decode() if metadata else None
+                ))
+            if not values:
+                return 0
+
+            with self.db.get_connection() as conn:
+                return self._insert_rows(
+                    conn,
+                    _SQL_INSERT,
+                    values,
+                    width=5
                 )
-            )
         except Exception as e:
-            raise DatabaseError(f"Failed to save embedding: {str(e)}")
+            raise DatabaseError(f"Failed to save embeddings: {str(e)}")
 
-    def get(self, character_id: int) -> Optional[List[float]]:
+    def get(self, character_id: int) -> Optional[np.ndarray]:
         """
         Get embedding for a character.
 
@@ -55,21 +218,74 @@ class EmbeddingRepository(BaseRepository):
             character_id: Character ID
 
         Returns:
-            Embedding vector if found, None otherwise
+            Normalized embedding vector if found, None otherwise
         """
         try:
-            query = """
-                SELECT embedding FROM character_embeddings
-                WHERE character_id = ?
-            """
-            row = self.db.execute(query, (character_id,), fetch_one=True)
+            row = self.db.execute(_SQL_GET, (character_id,), fetch_one=True)
 
             if row:
-                return json.loads(row['embedding'])
+                return EmbeddingQuantizer.dequantize(row['embedding'], row['scale'])
             return None
         except Exception as e:
             raise DatabaseError(f"Failed to fetch embedding: {str(e)}")
 
+    def get_many(self, character_ids: Iterable[int]) -> Dict[int, np.ndarray]:
+        """
+        Get embeddings for several characters with one query per chunk of IDs.
+
+        Args:
+            character_ids: Character IDs
+
+        Returns:
+            Mapping of character ID to normalized embedding, for the IDs
+            that have one
+        """
+        ids = list(dict.fromkeys(character_ids))
+        embeddings: Dict[int, np.ndarray] = {}
+
+        try:
+            for i in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[i:i + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                    SELECT character_id, embedding, scale FROM character_embeddings
+                    WHERE character_id IN ({placeholders})
+                """
+                rows = self.db.execute(query, tuple(chunk), fetch_all=True)
+
+                for row in rows or []:
+                    embeddings[row['character_id']] = EmbeddingQuantizer.dequantize(row['embedding'], row['scale'])
+
+            return embeddings
+        except Exception as e:
+            raise DatabaseError(f"Failed to fetch embeddings: {str(e)}")
+
+    def iter_all(
+        self
+    ) -> Iterator[Tuple[int, str, np.ndarray, Optional[Dict[str, Any]]]]:
+        """
+        Iterate over all character embeddings without loading them at once.
+
+        Rows are read from the cursor as they are consumed.
+
+        Yields:
+            (character_id, character_name, embedding, metadata) tuples
+
+        Raises:
+            DatabaseError: If the query fails
+        """
+        try:
+            with self.db.get_connection() as conn:
+                for character_id, character_name, embedding, scale, metadata in conn.execute(_SQL_GET_ALL):
+                    yield (
+                        character_id,
+                        character_name,
+                        EmbeddingQuantizer.dequantize(embedding, scale),
+                        orjson.loads(metadata) if metadata else None
+                    )
+        except Exception as e:
+            raise DatabaseError(f"Failed to fetch all embeddings: {str(e)}")
+
     def get_all(self) -> List[Dict[str, Any]]:
         """
         Get all character embeddings.
@@ -77,25 +293,120 @@ class EmbeddingRepository(BaseRepository):
         Returns:
             List of dictionaries with character ID, name, embedding, and metadata
         """
+        return [
+            {
+                'character_id': character_id,
+                'character_name': character_name,
+                'embedding': embedding,
+                'metadata': metadata
+            }
+            for character_id, character_name, embedding, metadata in self.iter_all()
+        ]
+
+    def get_all_with_fields(self, fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Get all character embeddings with selected metadata fields.
+
+        The fields are extracted by SQLite (json_extract), so the metadata
+        JSON is never parsed in Python.
+
+        Args:
+            fields: Top-level metadata keys to include, e.g. ["species"]
+
+        Returns:
+            List of dictionaries with character ID, name, embedding, and
+            one entry per requested field (None when missing)
+
+        Raises:
+            ValueError: If a field name is not a plain identifier
+            DatabaseError: If the query fails
+        """
+        fields = list(fields)
+        for name in fields:
+            if not _FIELD_NAME.match(name):
+                raise ValueError(f"Invalid metadata field name: {name!r}")
+
+        extracts = "".join(f', json_extract(metadata, ?) AS "{name}"' for name in fields)
+        query = f"""
+            SELECT character_id, character_name, embedding, scale{extracts}
+            FROM character_embeddings
+        """
+
         try:
-            query = """
-                SELECT character_id, character_name, embedding, metadata
-                FROM character_embeddings
-            """
-            rows = self.db.execute(query, fetch_all=True)
+            rows = self.db.execute(
+                query,
+                tuple(f"$.{name}" for name in fields),
+                fetch_all=True
+            )
 
             return [
                 {
-                    'character_id': row['character_id'],
-                    'character_name': row['character_name'],
-                    'embedding': json.loads(row['embedding']),
-                    'metadata': json.loads(row['metadata']) if row['metadata'] else None
+                    'character_id': row[0],
+                    'character_name': row[1],
+                    'embedding': EmbeddingQuantizer.dequantize(row[2], row[3]),
+                    **{name: row[4 + i] for i, name in enumerate(fields)}
                 }
-                for row in (rows or [])
+                for row in rows or []
             ]
         except Exception as e:
             raise DatabaseError(f"Failed to fetch all embeddings: {str(e)}")
 
+    def get_index(self) -> EmbeddingIndex:
+        """
+        Get all embeddings stacked into one contiguous matrix.
+
+        The index is cached in memory and rebuilt only when the table
+        changes. Changes are detected from the row count and highest row
+        id, which grows on every insert or replace.
+
+        Returns:
+            EmbeddingIndex with a float32 matrix of shape (N, D)
+        """
+        try:
+            with self.db.get_connection() as conn:
+                row = conn.execute(_SQL_INDEX_VERSION).fetchone()
+                version = (row[0], row[1])
+
+                cached = self._index
+                if cached is not None and cached[0] == version:
+                    return cached[1]
+
+                # Stream rows straight into preallocated buffers; the row
+                # count is known from the version query in this transaction
+                count = version[0]
+                character_ids = np.empty(count, dtype=np.int64)
+                scales = np.empty(count, dtype=np.float32)
+                character_names: List[str] = []
+                metadata: List[Optional[Dict[str, Any]]] = []
+                quantized: Optional[np.ndarray] = None
+
+                cursor = conn.execute(_SQL_INDEX_ROWS)
+                for i, (character_id, character_name, embedding, scale, meta) in enumerate(cursor):
+                    if quantized is None:
+                        quantized = np.empty((count, len(embedding)), dtype=np.int8)
+                    quantized[i] = np.frombuffer(embedding, dtype=np.int8)
+                    character_ids[i] = character_id
+                    scales[i] = scale
+                    character_names.append(character_name)
+                    metadata.append(orjson.loads(meta) if meta else None)
+
+            if quantized is not None:
+                # Dequantize the whole matrix in a single pass
+                vectors = EmbeddingQuantizer.dequantize_matrix(quantized, scales)
+            else:
+                vectors = np.empty((0, 0), dtype=np.float32)
+            index = EmbeddingIndex(
+                character_ids=character_ids,
+                character_names=character_names,
+                metadata=metadata,
+                vectors=vectors
+            )
+
+            self._index = (version, index)
+            return index
+        except Exception as e:
+            raise DatabaseError(f"Failed to load embedding index: {str(e)}")
+
     def exists(self, character_id: int) -> bool:
         """
         Check if embedding exists for a character.
@@ -107,12 +418,36 @@ class EmbeddingRepository(BaseRepository):
             True if exists, False otherwise
         """
         try:
-            query = """
-                SELECT 1 FROM character_embeddings
-                WHERE character_id = ?
-            """
-            row = self.db.execute(query, (character_id,), fetch_one=True)
-            return row is not None
+            row = self.db.execute(_SQL_EXISTS, (character_id,), fetch_one=True)
+            return bool(row[0])
+        except Exception as e:
+            raise DatabaseError(f"Failed to check embedding existence: {str(e)}")
+
+    def exists_many(self, character_ids: Iterable[int]) -> Set[int]:
+        """
+        Check which of several characters have an embedding.
+
+        Args:
+            character_ids: Character IDs
+
+        Returns:
+            Set of the given IDs that have an embedding
+        """
+        ids = list(dict.fromkeys(character_ids))
+        present: Set[int] = set()
+
+        try:
+            for i in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[i:i + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                    SELECT character_id FROM character_embeddings
+                    WHERE character_id IN ({placeholders})
+                """
+                rows = self.db.execute(query, tuple(chunk), fetch_all=True)
+                present.update(row[0] for row in rows or [])
+
+            return present
         except Exception as e:
             raise DatabaseError(f"Failed to check embedding existence: {str(e)}")
 
@@ -127,11 +462,7 @@ class EmbeddingRepository(BaseRepository):
             True if deleted, False if not found
         """
         try:
-            query = "DELETE FROM character_embeddings WHERE character_id = ?"
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (character_id,))
-                return cursor.rowcount > 0
+            return self.db.execute(_SQL_DELETE, (character_id,), return_rowcount=True) > 0
         except Exception as e:
             raise DatabaseError(f"Failed to delete embedding: {str(e)}")
 
@@ -143,8 +474,7 @@ class EmbeddingRepository(BaseRepository):
             Number of indexed characters
         """
         try:
-            query = "SELECT COUNT(*) as count FROM character_embeddings"
-            row = self.db.execute(query, fetch_one=True)
+            row = self.db.execute(_SQL_COUNT, fetch_one=True)
             return row['count'] if row else 0
         except Exception as e:
             raise DatabaseError(f"Failed to count embeddings: {str(e)}")
@@ -1,11 +1,28 @@
 """Note repository for database operations."""
 
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.models import Note
 from src.utils import DatabaseError
-from .base import BaseRepository
+from .base import BaseRepository, _MAX_IN_PARAMS
+
+# Column order expected by Note.from_row
+_NOTE_COLUMNS = "id, character_id, character_name, note, created_at, updated_at"
+
+_SQL_INSERT = "INSERT INTO character_notes (character_id, character_name, note)"
+_SQL_CREATE = _SQL_INSERT + " VALUES (?, ?, ?)"
+_SQL_BY_CHARACTER = f"""
+    SELECT {_NOTE_COLUMNS} FROM character_notes
+    WHERE character_id = ?
+    ORDER BY created_at DESC
+"""
+_SQL_UPDATE = """
+    UPDATE character_notes
+    SET note = ?, updated_at = CAST(strftime('%s', 'now') AS INTEGER)
+    WHERE id = ?
+"""
+_SQL_DELETE = "DELETE FROM character_notes WHERE id = ?"
+_SQL_BY_ID = f"SELECT {_NOTE_COLUMNS} FROM character_notes WHERE id = ?"
 
 
 class NoteRepository(BaseRepository):
@@ -27,15 +44,42 @@ class NoteRepository(BaseRepository):
             DatabaseError: If creation fails
         """
         try:
-            query = """
-                INSERT INTO character_notes (character_id, character_name, note)
-                VALUES (?, ?, ?)
-            """
-            note_id = self.db.execute(query, (character_id, character_name, note))
+            note_id = self.db.execute(_SQL_CREATE, (character_id, character_name, note))
             return note_id
         except Exception as e:
             raise DatabaseError(f"Failed to create note: {str(e)}")
 
+    def create_many(self, rows: Iterable[Tuple[int, str, str]]) -> int:
+        """
+        Create several notes in a single transaction.
+
+        Notes are written with multi-row INSERT statements rather than
+        one statement per note.
+
+        Args:
+            rows: (character_id, character_name, note) tuples
+
+        Returns:
+            Number of notes created
+
+        Raises:
+            DatabaseError: If creation fails
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        try:
+            with self.db.get_connection() as conn:
+                return self._insert_rows(
+                    conn,
+                    _SQL_INSERT,
+                    rows,
+                    width=3
+                )
+        except Exception as e:
+            raise DatabaseError(f"Failed to create notes: {str(e)}")
+
     def get_by_character_id(self, character_id: int) -> List[Note]:
         """
         Get all notes for a character.
@@ -47,20 +91,50 @@ class NoteRepository(BaseRepository):
             List of notes for the character
         """
         try:
-            query = """
-                SELECT * FROM character_notes
-                WHERE character_id = ?
-                ORDER BY created_at DESC
-            """
-            rows = self.db.execute(query, (character_id,), fetch_all=True)
+            rows = self.db.execute(_SQL_BY_CHARACTER, (character_id,), fetch_all=True)
 
             return [
-                Note.from_dict(dict(row))
+                Note.from_row(row)
                 for row in (rows or [])
             ]
         except Exception as e:
             raise DatabaseError(f"Failed to fetch notes: {str(e)}")
 
+    def get_by_character_ids(
+        self,
+        character_ids: Iterable[int]
+    ) -> Dict[int, List[Note]]:
+        """
+        Get notes for several characters with one query per chunk of IDs.
+
+        Args:
+            character_ids: IDs of the characters
+
+        Returns:
+            Mapping of every requested character ID to its notes
+        """
+        ids = list(dict.fromkeys(character_ids))
+        notes: Dict[int, List[Note]] = {character_id: [] for character_id in ids}
+
+        try:
+            for i in range(0, len(ids), _MAX_IN_PARAMS):
+                chunk = ids[i:i + _MAX_IN_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                query = f"""
+                    SELECT {_NOTE_COLUMNS} FROM character_notes
+                    WHERE character_id IN ({placeholders})
+                    ORDER BY created_at DESC
+                """
+                rows = self.db.execute(query, tuple(chunk), fetch_all=True)
+
+                for row in rows or []:
+                    note = Note.from_row(row)
+                    notes[note.character_id].append(note)
+
+            return notes
+        except Exception as e:
+            raise DatabaseError(f"Failed to fetch notes: {str(e)}")
+
     def update(self, note_id: int, note: str) -> bool:
         """
         Update an existing note.
@@ -76,15 +150,7 @@ class NoteRepository(BaseRepository):
             DatabaseError: If update fails
         """
         try:
-            query = """
-                UPDATE character_notes
-                SET note = ?, updated_at = ?
-                WHERE id = ?
-            """
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (note, datetime.now(), note_id))
-                return cursor.rowcount > 0
+            return self.db.execute(_SQL_UPDATE, (note, note_id), return_rowcount=True) > 0
         except Exception as e:
             raise DatabaseError(f"Failed to update note: {str(e)}")
 
@@ -102,11 +168,7 @@ class NoteRepository(BaseRepository):
             DatabaseError: If deletion fails
         """
         try:
-            query = "DELETE FROM character_notes WHERE id = ?"
-            with self.db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, (note_id,))
-                return cursor.rowcount > 0
+            return self.db.execute(_SQL_DELETE, (note_id,), return_rowcount=True) > 0
         except Exception as e:
             raise DatabaseError(f"Failed to delete note: {str(e)}")
 
@@ -121,11 +183,10 @@ class NoteRepository(BaseRepository):
             Note if found, None otherwise
         """
         try:
-            query = "SELECT * FROM character_notes WHERE id = ?"
-            row = self.db.execute(query, (note_id,), fetch_one=True)
+            row = self.db.execute(_SQL_BY_ID, (note_id,), fetch_one=True)
 
             if row:
-                return Note.from_dict(dict(row))
+                return Note.from_row(row)
             return None
         except Exception as e:
             raise DatabaseError(f"Failed to fetch note: {str(e)}")
@@ -1,8 +1,23 @@
 """Service layer for business logic."""
 
 from .rick_morty_service import RickMortyService
-from .gemini_service import GeminiService
-from .search_service import SearchService
+
+# Loaded on first access (PEP 562) so google.generativeai and numpy are
+# not imported unless the AI features are actually used.
+_LAZY_IMPORTS = {
+    "GeminiService": ".gemini_service",
+    "SearchService": ".search_service",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "RickMortyService",
@@ -1,16 +1,26 @@
 """Gemini AI service for generative features and embeddings."""
 
-import google.generativeai as genai
-from typing import List, Dict, Any, Optional
-import numpy as np
+import hashlib
+import importlib
+import re
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.config import GeminiConfig
 from src.models import Character, Location
-from src.utils import GeminiNotConfiguredError
+from src.utils import DatabaseError, GeminiNotConfiguredError
 
+if TYPE_CHECKING:
+    import numpy as np
+    from src.repositories import CacheRepository, EmbeddingCacheRepository
 
-@dataclass
+# One "Key: value" pair per line of an evaluation response
+_EVAL_LINE_RE = re.compile(r"^[ \t]*([^:\n]+?)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+_SCORE_RE = re.compile(r"\d+")
+
+
+@dataclass(frozen=True, slots=True)
 class EvaluationResult:
     """Result from LLM evaluation."""
 
@@ -32,12 +42,21 @@ class EvaluationResult:
 class GeminiService:
     """Service for Gemini AI operations."""
 
-    def __init__(self, config: GeminiConfig):
+    def __init__(
+        self,
+        config: GeminiConfig,
+        cache_repo: Optional["CacheRepository"] = None,
+        embedding_cache: Optional["EmbeddingCacheRepository"] = None
+    ):
         """
         Initialize Gemini service.
 
         Args:
             config: Gemini configuration
+            cache_repo: Optional cache for generated responses; identical
+                prompts within the TTL reuse the stored response
+            embedding_cache: Optional persistent cache of document
+                embeddings by text
 
         Raises:
             GeminiNotConfiguredError: If API key not configured
@@ -46,10 +65,96 @@ class GeminiService:
             raise GeminiNotConfiguredError()
 
         self.config = config
-        genai.configure(api_key=config.api_key)
-        self.model = genai.GenerativeModel(config.model_name)
+        self.cache_repo = cache_repo
+        self.embedding_cache = embedding_cache
+
+        # Imported here so the SDK is only loaded when Gemini is configured
+        self._genai = importlib.import_module("google.generativeai")
+        self._genai.configure(api_key=config.api_key)
+        self.model = self._genai.GenerativeModel(config.model_name)
         self.embedding_model = config.embedding_model
 
+    def _generate(self, prompt: str) -> str:
+        """
+        Generate text for a prompt, reusing a cached response if available.
+
+        Only exact prompt matches are reused: prompts that merely look
+        alike usually differ in the character or location they describe.
+
+        Args:
+            prompt: Full prompt text
+
+        Returns:
+            Generated text
+        """
+        if self.cache_repo is None:
+            return self.model.generate_content(prompt).text
+
+        digest = hashlib.blake2b(
+            f"{self.config.model_name}\n{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_key = f"gemini:{digest}"
+
+        cached = self.cache_repo.get(cache_key)
+        if cached is not None:
+            return cached['text']
+
+        text = self.model.generate_content(prompt).text
+        try:
+            self.cache_repo.set(
+                cache_key,
+                {'text': text},
+                ttl_minutes=self.config.response_cache_ttl_minutes
+            )
+        except DatabaseError as e:
+            print(f"Warning: could not cache Gemini response: {e}")
+        return text
+
+    def _embed(
+        self,
+        texts: Sequence[str],
+        task_type: str,
+        use_cache: bool = True
+    ) -> List[List[float]]:
+        """
+        Embed texts, reusing cached vectors for texts embedded before.
+
+        Texts missing from the cache are embedded together; the SDK sends
+        them as batch requests rather than one request per text.
+
+        Args:
+            texts: Texts to embed
+            task_type: Gemini embedding task type
+            use_cache: Whether to use the persistent embedding cache
+
+        Returns:
+            Embedding vectors, in input order
+        """
+        cache = self.embedding_cache if use_cache else None
+        if cache is not None:
+            embeddings = cache.get_many(texts, self.embedding_model, task_type)
+        else:
+            embeddings = {}
+
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+        if missing:
+            result = self._genai.embed_content(
+                model=self.embedding_model,
+                content=missing,
+                task_type=task_type
+            )
+            fresh = dict(zip(missing, result['embedding']))
+            embeddings.update(fresh)
+
+            if cache is not None:
+                try:
+                    cache.set_many(fresh, self.embedding_model, task_type)
+                except DatabaseError as e:
+                    print(f"Warning: could not cache embeddings: {e}")
+
+        return [embeddings[text] for text in texts]
+
     def generate_location_summary(self, location: Location) -> str:
         """
         Generate Rick & Morty style narration for a location.
@@ -61,10 +166,14 @@ class GeminiService:
             Generated summary text
         """
         context = location.get_summary_context()
-        prompt = self._build_location_summary_prompt(context)
+        prompt = self._build_location_summary_prompt(
+            context['name'],
+            context['type'],
+            context['dimension'],
+            context['resident_count']
+        )
 
-        response = self.model.generate_content(prompt)
-        return response.text
+        return self._generate(prompt)
 
     def generate_location_image_prompt(self, location: Location, summary: str) -> str:
         """
@@ -94,8 +203,7 @@ class GeminiService:
         Return ONLY the image prompt, nothing else.
         """
 
-        response = self.model.generate_content(prompt)
-        return response.text.strip()
+        return self._generate(prompt).strip()
 
     def generate_character_dialogue(
         self,
@@ -112,9 +220,11 @@ class GeminiService:
         Returns:
             Generated dialogue text
         """
-        prompt = self._build_dialogue_prompt(character1, character2)
-        response = self.model.generate_content(prompt)
-        return response.text
+        prompt = self._build_dialogue_prompt(
+            character1.name, character1.species, character1.status, character1.location.name,
+            character2.name, character2.species, character2.status, character2.location.name
+        )
+        return self._generate(prompt)
 
     def generate_dialogue_image_prompt(
         self,
@@ -152,8 +262,7 @@ class GeminiService:
         Return ONLY the image prompt, nothing else.
         """
 
-        response = self.model.generate_content(prompt)
-        return response.text.strip()
+        return self._generate(prompt).strip()
 
     def generate_character_analysis(self, character: Character) -> str:
         """
@@ -165,9 +274,16 @@ class GeminiService:
         Returns:
             Generated analysis text
         """
-        prompt = self._build_analysis_prompt(character)
-        response = self.model.generate_content(prompt)
-        return response.text
+        prompt = self._build_analysis_prompt(
+            character.name,
+            character.species,
+            character.status,
+            character.gender,
+            character.origin.name,
+            character.location.name,
+            len(character.episode)
+        )
+        return self._generate(prompt)
 
     def generate_embedding(self, text: str) -> List[float]:
         """
@@ -179,12 +295,19 @@ class GeminiService:
         Returns:
             Embedding vector
         """
-        result = genai.embed_content(
-            model=self.embedding_model,
-            content=text,
-            task_type="retrieval_document"
-        )
-        return result['embedding']
+        return self._embed([text], "retrieval_document")[0]
+
+    def generate_embeddings(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for several documents at once.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in input order
+        """
+        return self._embed(texts, "retrieval_document")
 
     def generate_query_embedding(self, query: str) -> List[float]:
         """
@@ -196,12 +319,9 @@ class GeminiService:
         Returns:
             Query embedding vector
         """
-        result = genai.embed_content(
-            model=self.embedding_model,
-            content=query,
-            task_type="retrieval_query"
-        )
-        return result['embedding']
+        # Free-form queries rarely repeat across runs; SearchService keeps
+        # recent ones in memory instead of persisting every query
+        return self._embed([query], "retrieval_query", use_cache=False)[0]
 
     def evaluate_factual_consistency(
         self,
@@ -223,8 +343,7 @@ class GeminiService:
             source_data
         )
 
-        response = self.model.generate_content(prompt)
-        return self._parse_evaluation_response(response.text)
+        return self._parse_evaluation_response(self._generate(prompt))
 
     def evaluate_creativity(self, generated_text: str) -> EvaluationResult:
         """
@@ -237,8 +356,7 @@ class GeminiService:
             EvaluationResult with score and details
         """
         prompt = self._build_creativity_prompt(generated_text)
-        response = self.model.generate_content(prompt)
-        return self._parse_evaluation_response(response.text)
+        return self._parse_evaluation_response(self._generate(prompt))
 
     @staticmethod
     def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
@@ -252,76 +370,133 @@ class GeminiService:
         Returns:
             Cosine similarity score (0 to 1)
         """
-        arr1 = np.array(vec1)
-        arr2 = np.array(vec2)
+        return float(GeminiService.cosine_similarity_batch(vec1, [vec2])[0])
+
+    @staticmethod
+    def cosine_similarity_batch(
+        query: Sequence[float],
+        corpus: Sequence[Sequence[float]]
+    ) -> "np.ndarray":
+        """
+        Calculate cosine similarity between a query and many vectors.
 
-        dot_product = np.dot(arr1, arr2)
-        norm1 = np.linalg.norm(arr1)
-        norm2 = np.linalg.norm(arr2)
+        All rows are scored with a single float32 matrix-vector product
+        and one fused pass for the row norms.
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+        Args:
+            query: Query vector of length D
+            corpus: Vectors to compare against, shape (N, D)
+
+        Returns:
+            Array of N similarity scores; 0 for zero-length vectors
+
+        Raises:
+            ValueError: If the corpus is not an (N, D) matrix
+        """
+        import numpy as np
 
-        return float(dot_product / (norm1 * norm2))
+        query_arr = np.asarray(query, dtype=np.float32)
+        if len(corpus) == 0:
+            corpus_arr = np.empty((0, query_arr.shape[0]), dtype=np.float32)
+        else:
+            corpus_arr = np.asarray(corpus, dtype=np.float32)
 
-    # Private helper methods for building prompts
+        if corpus_arr.ndim != 2 or corpus_arr.shape[1] != query_arr.shape[0]:
+            raise ValueError(
+                f"Corpus of shape {corpus_arr.shape} does not match "
+                f"query dimension {query_arr.shape[0]}"
+            )
+
+        scores = corpus_arr @ query_arr
+        # Row norms via einsum avoid materializing the squared (N, D) matrix
+        norms = np.sqrt(np.einsum('ij,ij->i', corpus_arr, corpus_arr))
+        norms *= np.linalg.norm(query_arr)
+        return np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
+
+    # Private helper methods for building prompts. The entity builders take
+    # plain field values so identical inputs reuse the cached prompt string.
 
     @staticmethod
-    def _build_location_summary_prompt(context: Dict[str, Any]) -> str:
+    @lru_cache(maxsize=1024)
+    def _build_location_summary_prompt(
+        name: str,
+        type_: str,
+        dimension: str,
+        resident_count: int
+    ) -> str:
         """Build prompt for location summary generation."""
         return f"""
         You are the narrator from Rick and Morty. Generate a short, witty summary (2-3 sentences)
         about this location in the distinctive cynical and absurdist tone of the show.
 
         Location Details:
-        - Name: {context['name']}
-        - Type: {context['type']}
-        - Dimension: {context['dimension']}
-        - Number of Residents: {context['resident_count']}
+        - Name: {name}
+        - Type: {type_}
+        - Dimension: {dimension}
+        - Number of Residents: {resident_count}
 
         Make it funny, slightly dark, and remember to include some existential dread or sci-fi absurdity.
         """
 
     @staticmethod
-    def _build_dialogue_prompt(char1: Character, char2: Character) -> str:
+    @lru_cache(maxsize=1024)
+    def _build_dialogue_prompt(
+        name1: str,
+        species1: str,
+        status1: str,
+        location1: str,
+        name2: str,
+        species2: str,
+        status2: str,
+        location2: str
+    ) -> str:
         """Build prompt for character dialogue generation."""
         return f"""
         Generate a short dialogue (4-6 lines) between these two Rick and Morty characters.
         Make it authentic to the show's humor and the characters' personalities.
 
         Character 1:
-        - Name: {char1.name}
-        - Species: {char1.species}
-        - Status: {char1.status}
-        - Location: {char1.location.name}
+        - Name: {name1}
+        - Species: {species1}
+        - Status: {status1}
+        - Location: {location1}
 
         Character 2:
-        - Name: {char2.name}
-        - Species: {char2.species}
-        - Status: {char2.status}
-        - Location: {char2.location.name}
+        - Name: {name2}
+        - Species: {species2}
+        - Status: {status2}
+        - Location: {location2}
 
         Format the dialogue as:
-        {char1.name}: [their line]
-        {char2.name}: [their line]
+        {name1}: [their line]
+        {name2}: [their line]
         (continue for 4-6 exchanges)
         """
 
     @staticmethod
-    def _build_analysis_prompt(character: Character) -> str:
+    @lru_cache(maxsize=1024)
+    def _build_analysis_prompt(
+        name: str,
+        species: str,
+        status: str,
+        gender: str,
+        origin: str,
+        location: str,
+        episode_count: int
+    ) -> str:
         """Build prompt for character analysis."""
         return f"""
         Provide a brief character analysis (2-3 sentences) for this Rick and Morty character.
         Focus on their significance, relationships, or interesting facts.
 
         Character:
-        - Name: {character.name}
-        - Species: {character.species}
-        - Status: {character.status}
-        - Gender: {character.gender}
-        - Origin: {character.origin.name}
-        - Current Location: {character.location.name}
-        - Episodes Appeared: {len(character.episode)}
+        - Name: {name}
+        - Species: {species}
+        - Status: {status}
+        - Gender: {gender}
+        - Origin: {origin}
+        - Current Location: {location}
+        - Episodes Appeared: {episode_count}
 
         Be informative but keep the Rick and Morty vibe.
         """
@@ -377,26 +552,19 @@ class GeminiService:
         Returns:
             EvaluationResult instance
         """
-        lines = response_text.strip().split('\n')
         score = 0
         reasoning = ""
         details = {}
 
-        for line in lines:
-            if line.startswith('Score:'):
-                try:
-                    score_str = line.replace('Score:', '').strip()
-                    # Extract just the number
-                    score_str = ''.join(filter(str.isdigit, score_str))
-                    score = int(score_str) if score_str else 0
-                    score = min(max(score, 0), 10)  # Clamp to 0-10
-                except ValueError:
-                    score = 0
-            elif line.startswith('Reasoning:'):
-                reasoning = line.replace('Reasoning:', '').strip()
-            elif ':' in line:
-                key, value = line.split(':', 1)
-                details[key.strip()] = value.strip()
+        for key, value in _EVAL_LINE_RE.findall(response_text):
+            if key == 'Score':
+                # First number only, so "8/10" scores 8
+                match = _SCORE_RE.search(value)
+                score = min(int(match.group()), 10) if match else 0
+            elif key == 'Reasoning':
+                reasoning = value
+            else:
+                details[key] = value
 
         return EvaluationResult(
             score=score,
@@ -1,10 +1,16 @@
 """Image generation service for AI features."""
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Sequence
 from urllib.parse import quote
 import time
 
+# Concurrent requests used by verify_image_urls
+_VERIFY_WORKERS = 8
+
 
 class ImageGenerationService:
     """Service for generating images using AI models."""
@@ -13,6 +19,18 @@ class ImageGenerationService:
         """Initialize image generation service."""
         # Using Pollinations AI - free, no API key required
         self.base_url = "https://image.pollinations.ai/prompt"
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a session that keeps connections to image hosts alive."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=_VERIFY_WORKERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        atexit.register(session.close)
+        return session
 
     def generate_image_url(
         self,
@@ -115,6 +133,10 @@ class ImageGenerationService:
         """
         Verify that an image URL is accessible.
 
+        Requests only the first byte of the image: image hosts often do
+        not cache HEAD requests, and a ranged GET is served from the same
+        cache as a real download.
+
         Args:
             url: Image URL to verify
             timeout: Request timeout in seconds
@@ -123,11 +145,34 @@ class ImageGenerationService:
             True if image is accessible, False otherwise
         """
         try:
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
-            return response.status_code == 200
+            with self._session.get(
+                url,
+                headers={'Range': 'bytes=0-0'},
+                timeout=timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                return response.status_code in (200, 206)
         except Exception:
             return False
 
+    def verify_image_urls(self, urls: Sequence[str], timeout: int = 10) -> List[bool]:
+        """
+        Verify several image URLs concurrently.
+
+        Args:
+            urls: Image URLs to verify
+            timeout: Request timeout in seconds, per URL
+
+        Returns:
+            Accessibility of each URL, in input order
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(_VERIFY_WORKERS, len(urls))) as executor:
+            return list(executor.map(lambda url: self.verify_image_url(url, timeout), urls))
+
     def get_character_image_url(self, character_data: dict) -> Optional[str]:
         """
         Get character image URL from Rick and Morty API data.
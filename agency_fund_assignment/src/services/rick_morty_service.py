@@ -1,14 +1,32 @@
 """Rick and Morty API service with clean architecture."""
 
+import atexit
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from functools import lru_cache
+import orjson
+from urllib3.util.retry import Retry
 
 from src.models import Character, Location
 from src.repositories import CacheRepository
 from src.config import APIConfig
 from src.utils import ExternalAPIError, NotFoundError
 
+# Most character IDs the API accepts in one multi-ID request
+_CHARACTER_BATCH_SIZE = 100
+
+
+@lru_cache(maxsize=4096)
+def _hash_cache_key(endpoint: str, params: FrozenSet[Tuple[str, Any]]) -> str:
+    """Hash an endpoint and its params into a fixed-length cache key."""
+    payload = orjson.dumps([endpoint, dict(params)], option=orjson.OPT_SORT_KEYS)
+    return f"rick_morty:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
 
 class RickMortyService:
     """
@@ -37,16 +55,59 @@ class RickMortyService:
         self.base_url = config.rick_morty_base_url
         self._session = self._create_session()
 
+        # Fans out independent page and batch requests; tasks submitted
+        # here must not submit further work to the same executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_connections,
+            thread_name_prefix="rick-morty-fetch"
+        )
+        atexit.register(self._executor.shutdown, wait=False)
+
+        # In-process caches for hot lookups; keys include a TTL bucket so
+        # entries expire together with the SQLite API cache
+        self._character_cache = lru_cache(maxsize=2048)(self._get_character_uncached)
+        self._location_cache = lru_cache(maxsize=1024)(self._get_location_uncached)
+
+    def _ttl_bucket(self) -> int:
+        """Get the current cache TTL window number."""
+        ttl_seconds = max(self.config.cache_ttl_minutes * 60, 1)
+        return int(time.time() // ttl_seconds)
+
     def _create_session(self) -> requests.Session:
-        """Create configured requests session."""
+        """
+        Create configured requests session.
+
+        The session keeps TLS connections to the API alive and pooled, so
+        concurrent workers reuse them instead of handshaking per call. The
+        pool holds one keep-alive connection per fetch worker; a larger
+        pool would sit idle and a smaller one would drop connections.
+        """
         session = requests.Session()
         session.headers.update({'Content-Type': 'application/json'})
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.config.max_connections,
+            max_retries=Retry(
+                total=self.config.max_retries,
+                backoff_factor=0.1,
+                status_forcelist=(429, 500, 502, 503, 504)
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        atexit.register(session.close)
         return session
 
     def _build_cache_key(self, endpoint: str, params: Optional[Dict] = None) -> str:
-        """Build cache key from endpoint and params."""
-        params_str = str(sorted(params.items())) if params else ""
-        return f"rick_morty:{endpoint}:{params_str}"
+        """
+        Build cache key from endpoint and params.
+
+        Keys are a blake2b digest of the canonical (key-sorted) request,
+        memoized per distinct request.
+        """
+        return _hash_cache_key(endpoint, frozenset(params.items()) if params else frozenset())
 
     def _fetch(
         self,
@@ -86,7 +147,7 @@ class RickMortyService:
                 timeout=self.config.request_timeout
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Cache successful response
             if use_cache:
@@ -104,6 +165,38 @@ class RickMortyService:
             raise ExternalAPIError(f"Rick and Morty API error: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise ExternalAPIError(f"Network error: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            raise ExternalAPIError(f"Invalid response from Rick and Morty API: {str(e)}")
+
+    def _fetch_all_pages(self, endpoint: str) -> Iterator[Dict[str, Any]]:
+        """
+        Fetch every page of a paginated endpoint.
+
+        The first page gives the page count; the remaining pages are then
+        requested concurrently. All pages are fetched before returning;
+        the entries are iterated straight out of the page payloads, so
+        callers build their result list in one pass without a flattened
+        copy in between.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            Result entries of all pages, in page order
+
+        Raises:
+            ExternalAPIError: If API request fails
+        """
+        first = self._fetch(endpoint, params={"page": 1})
+        total_pages = first['info'].get('pages') or 1
+
+        pages = [first]
+        pages.extend(self._executor.map(
+            lambda page: self._fetch(endpoint, params={"page": page}),
+            range(2, total_pages + 1)
+        ))
+
+        return chain.from_iterable(data['results'] for data in pages)
 
     def get_all_locations(self) -> List[Location]:
         """
@@ -115,22 +208,10 @@ class RickMortyService:
         Raises:
             ExternalAPIError: If API request fails
         """
-        locations = []
-        page = 1
-
-        while True:
-            data = self._fetch("location", params={"page": page})
-            page_locations = [
-                Location.from_dict(loc_data)
-                for loc_data in data['results']
-            ]
-            locations.extend(page_locations)
-
-            if not data['info'].get('next'):
-                break
-            page += 1
-
-        return locations
+        return [
+            Location.from_dict(loc_data)
+            for loc_data in self._fetch_all_pages("location")
+        ]
 
     def get_location(self, location_id: int) -> Location:
         """
@@ -146,6 +227,10 @@ class RickMortyService:
             NotFoundError: If location not found
             ExternalAPIError: If API request fails
         """
+        return self._location_cache(location_id, self._ttl_bucket())
+
+    def _get_location_uncached(self, location_id: int, _ttl_bucket: int) -> Location:
+        """Fetch a location, bypassing the in-process cache."""
         data = self._fetch(f"location/{location_id}")
         return Location.from_dict(data)
 
@@ -163,23 +248,26 @@ class RickMortyService:
             NotFoundError: If location not found
             ExternalAPIError: If API request fails
         """
-        location_data = self._fetch(f"location/{location_id}")
+        location = self.get_location(location_id)
 
-        if not location_data['residents']:
-            return Location.from_dict(location_data, residents_details=[])
+        if not location.residents:
+            return location.with_residents([])
 
         # Extract resident IDs and batch fetch
         resident_ids = [
-            url.split('/')[-1]
-            for url in location_data['residents']
+            url.rsplit('/', 1)[1]
+            for url in location.residents
         ]
 
-        residents = self._fetch_characters_batch(resident_ids)
-
-        return Location.from_dict(
-            location_data,
-            residents_details=residents
+        # Batches of up to 100 (API limit), fetched concurrently in order
+        batches = self._executor.map(
+            self._fetch_characters_batch,
+            [
+                resident_ids[i:i + _CHARACTER_BATCH_SIZE]
+                for i in range(0, len(resident_ids), _CHARACTER_BATCH_SIZE)
+            ]
         )
+        return location.with_residents(list(chain.from_iterable(batches)))
 
     def get_all_locations_with_residents(self) -> List[Location]:
         """
@@ -193,33 +281,23 @@ class RickMortyService:
         """
         locations = self.get_all_locations()
 
-        # Collect all unique character IDs
-        all_character_ids = set()
-        for location in locations:
-            for resident_url in location.residents:
-                char_id = resident_url.split('/')[-1]
-                all_character_ids.add(char_id)
+        # Parse each resident URL once; the IDs are reused when attaching
+        resident_ids = [
+            [int(url.rsplit('/', 1)[1]) for url in location.residents]
+            for location in locations
+        ]
+        unique_ids = sorted(set(chain.from_iterable(resident_ids)))
 
         # Batch fetch all characters
-        characters_map = self._fetch_all_characters_map(list(all_character_ids))
+        characters_map = self._fetch_all_characters_map([str(i) for i in unique_ids])
 
         # Attach resident details to each location
-        result = []
-        for location in locations:
-            resident_details = []
-            for resident_url in location.residents:
-                char_id = int(resident_url.split('/')[-1])
-                if char_id in characters_map:
-                    resident_details.append(characters_map[char_id])
-
-            result.append(
-                Location.from_dict(
-                    location.to_dict(include_residents=False),
-                    residents_details=resident_details
-                )
+        return [
+            location.with_residents(
+                [characters_map[i] for i in ids if i in characters_map]
             )
-
-        return result
+            for location, ids in zip(locations, resident_ids)
+        ]
 
     def get_character(self, character_id: int) -> Character:
         """
@@ -235,6 +313,51 @@ class RickMortyService:
             NotFoundError: If character not found
             ExternalAPIError: If API request fails
         """
+        return self._character_cache(character_id, self._ttl_bucket())
+
+    def get_characters(self, character_ids: Iterable[int]) -> List[Character]:
+        """
+        Get several characters using the API's multi-ID endpoint.
+
+        Characters already cached individually are checked with one cache
+        lookup and served through get_character; the rest are requested in
+        batches of up to 100, fetched concurrently, rather than one request
+        per character.
+
+        Args:
+            character_ids: Character IDs
+
+        Returns:
+            Characters found, in the order of their first requested ID;
+            IDs that do not exist are left out
+
+        Raises:
+            ExternalAPIError: If API request fails
+        """
+        ids = list(dict.fromkeys(character_ids))
+        cache_keys = {
+            character_id: self._build_cache_key(f"character/{character_id}")
+            for character_id in ids
+        }
+        # Loads the hits into the cache repository's memory tier, so
+        # get_character resolves them without another query
+        cached = self.cache_repo.get_many(cache_keys.values())
+
+        characters_map = {
+            character_id: self.get_character(character_id)
+            for character_id, cache_key in cache_keys.items()
+            if cache_key in cached
+        }
+        missing = [str(i) for i in ids if i not in characters_map]
+        if missing:
+            characters_map.update(
+                self._fetch_all_characters_map(missing, skip_failed_batches=False)
+            )
+
+        return [characters_map[i] for i in ids if i in characters_map]
+
+    def _get_character_uncached(self, character_id: int, _ttl_bucket: int) -> Character:
+        """Fetch a character, bypassing the in-process cache."""
         data = self._fetch(f"character/{character_id}")
         return Character.from_dict(data)
 
@@ -290,31 +413,63 @@ class RickMortyService:
 
         return [Character.from_dict(char_data) for char_data in data]
 
+    def _fetch_character_payloads(self, character_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch the raw payloads of up to 100 characters in a single request."""
+        data = self._fetch(f"character/{','.join(character_ids)}")
+
+        # API returns single object for one ID, array for multiple
+        return [data] if isinstance(data, dict) else data
+
     def _fetch_all_characters_map(
         self,
-        character_ids: List[str]
+        character_ids: List[str],
+        skip_failed_batches: bool = True
     ) -> Dict[int, Character]:
         """
         Fetch all characters and return as a map.
 
+        Every fetched character is also cached under its single-character
+        key, in one write, so later lookups by ID can reuse the batch.
+
         Args:
             character_ids: List of character IDs
+            skip_failed_batches: Whether to leave out batches whose request
+                fails; batches of IDs the API reports missing are always
+                left out
 
         Returns:
             Dictionary mapping character ID to Character instance
+
+        Raises:
+            ExternalAPIError: If a batch request fails and
+                skip_failed_batches is False
         """
-        characters_map = {}
+        payloads = []
 
-        # Batch requests in groups of 100 (API limit)
-        batch_size = 100
-        for i in range(0, len(character_ids), batch_size):
-            batch = character_ids[i:i + batch_size]
+        # Batch requests in groups of 100 (API limit), fetched concurrently
+        futures = [
+            self._executor.submit(
+                self._fetch_character_payloads,
+                character_ids[i:i + _CHARACTER_BATCH_SIZE]
+            )
+            for i in range(0, len(character_ids), _CHARACTER_BATCH_SIZE)
+        ]
+
+        for future in as_completed(futures):
             try:
-                characters = self._fetch_characters_batch(batch)
-                for char in characters:
-                    characters_map[char.id] = char
-            except (ExternalAPIError, NotFoundError):
-                # Skip failed batches
+                payloads.extend(future.result())
+            except NotFoundError:
                 continue
+            except ExternalAPIError:
+                if not skip_failed_batches:
+                    raise
+
+        self.cache_repo.set_many(
+            (
+                (self._build_cache_key(f"character/{data['id']}"), data)
+                for data in payloads
+            ),
+            ttl_minutes=self.config.cache_ttl_minutes
+        )
 
-        return characters_map
+        return {data['id']: Character.from_dict(data) for data in payloads}
@@ -1,15 +1,21 @@
 """Semantic search service."""
 
+import logging
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
 
 from src.repositories import EmbeddingRepository
 from .gemini_service import GeminiService
 from .rick_morty_service import RickMortyService
 from src.models import Character
+from src.utils import DatabaseError, ExternalAPIError
 
+log = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Search result with similarity score."""
 
@@ -49,17 +55,35 @@ class SearchService:
         self.gemini_service = gemini_service
         self.rick_morty_service = rick_morty_service
 
+        # Repeated queries skip the embedding call and its cache lookup
+        self._query_embedding = lru_cache(maxsize=1024)(self._embed_query)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query as a read-only float32 vector."""
+        embedding = np.asarray(
+            self.gemini_service.generate_query_embedding(query),
+            dtype=np.float32
+        )
+        embedding.flags.writeable = False
+        return embedding
+
     def index_character(self, character_id: int) -> bool:
         """
         Index a single character for semantic search.
 
+        Characters that already have an embedding are skipped; use
+        `reindex_character` to rebuild one.
+
         Args:
             character_id: Character ID to index
 
         Returns:
-            True if successful, False otherwise
+            True if successful or already indexed, False otherwise
         """
         try:
+            if self.embedding_repo.exists(character_id):
+                return True
+
             character = self.rick_morty_service.get_character(character_id)
 
             # Generate embedding
@@ -67,22 +91,16 @@ class SearchService:
             embedding = self.gemini_service.generate_embedding(text)
 
             # Save to repository
-            metadata = {
-                "species": character.species,
-                "status": character.status,
-                "gender": character.gender
-            }
-
             self.embedding_repo.save(
                 character.id,
                 character.name,
                 embedding,
-                metadata
+                self._character_metadata(character)
             )
 
             return True
         except Exception as e:
-            print(f"Failed to index character {character_id}: {e}")
+            log.warning("Failed to index character %s: %s", character_id, e)
             return False
 
     def index_characters(
@@ -92,6 +110,9 @@ class SearchService:
         """
         Index multiple characters for semantic search.
 
+        Characters that already have an embedding are skipped and count
+        as indexed. Repeated IDs are indexed and counted once.
+
         Args:
             character_ids: List of character IDs to index (default: 1-50)
 
@@ -100,22 +121,58 @@ class SearchService:
         """
         if character_ids is None:
             character_ids = list(range(1, 51))  # Default to first 50
+        character_ids = list(dict.fromkeys(character_ids))
 
-        indexed_count = 0
-        errors = []
+        try:
+            already_indexed = self.embedding_repo.exists_many(character_ids)
+        except DatabaseError as e:
+            log.warning("Failed to index characters %s: %s", character_ids, e)
+            return {
+                "indexed_count": 0,
+                "errors": [
+                    {"character_id": char_id, "error": "Failed to index"}
+                    for char_id in character_ids
+                ]
+            }
+        pending_ids = [char_id for char_id in character_ids if char_id not in already_indexed]
 
-        for char_id in character_ids:
-            if self.index_character(char_id):
-                indexed_count += 1
-            else:
-                errors.append({
-                    "character_id": char_id,
-                    "error": "Failed to index"
-                })
+        # Fetch the remaining characters with batched multi-ID requests
+        try:
+            characters = self.rick_morty_service.get_characters(pending_ids) if pending_ids else []
+        except ExternalAPIError as e:
+            log.warning("Failed to fetch characters for indexing: %s", e)
+            characters = []
+        found_ids = {character.id for character in characters}
+        failed_ids = [char_id for char_id in pending_ids if char_id not in found_ids]
+        if failed_ids:
+            log.warning("Failed to index characters %s: characters could not be fetched", failed_ids)
+
+        # Embed all descriptions in one batch and save them together
+        if characters:
+            try:
+                embeddings = self.gemini_service.generate_embeddings(
+                    [character.get_description() for character in characters]
+                )
+                self.embedding_repo.save_many(
+                    (
+                        character.id,
+                        character.name,
+                        embedding,
+                        self._character_metadata(character)
+                    )
+                    for character, embedding in zip(characters, embeddings)
+                )
+            except Exception as e:
+                log.warning("Failed to index characters %s: %s", sorted(found_ids), e)
+                failed_ids.extend(character.id for character in characters)
+                characters = []
 
         return {
-            "indexed_count": indexed_count,
-            "errors": errors
+            "indexed_count": len(characters) + len(character_ids) - len(pending_ids),
+            "errors": [
+                {"character_id": char_id, "error": "Failed to index"}
+                for char_id in failed_ids
+            ]
         }
 
     def search(
@@ -135,40 +192,49 @@ class SearchService:
 
         Raises:
             ValueError: If no embeddings are indexed
+            ExternalAPIError: If the winning characters cannot be fetched
         """
-        # Get all embeddings
-        all_embeddings = self.embedding_repo.get_all()
+        index = self.embedding_repo.get_index()
 
-        if not all_embeddings:
+        if len(index) == 0:
             raise ValueError("No character embeddings found. Please index characters first.")
 
-        # Generate query embedding
-        query_embedding = self.gemini_service.generate_query_embedding(query)
+        # Rank all candidates at once
+        rows, scores = index.k_nearest(self._query_embedding(query), top_k)
 
-        # Calculate similarities
-        results = []
-        for item in all_embeddings:
-            similarity = self.gemini_service.cosine_similarity(
-                query_embedding,
-                item['embedding']
+        # Fetch full character details for the winners only, in one lookup
+        characters = {
+            character.id: character
+            for character in self.rick_morty_service.get_characters(
+                int(index.character_ids[row]) for row in rows
             )
+        }
 
-            # Fetch full character details
-            character = self.rick_morty_service.get_character(
-                item['character_id']
-            )
+        results = []
+        for row, similarity in zip(rows, scores):
+            character = characters.get(int(index.character_ids[row]))
+            if character is None:
+                # Reported missing by the API
+                continue
 
             results.append(
                 SearchResult(
                     character=character,
-                    similarity=similarity,
-                    metadata=item['metadata'] or {}
+                    similarity=float(similarity),
+                    metadata=index.metadata[row] or {}
                 )
             )
 
-        # Sort by similarity (highest first) and return top-k
-        results.sort(key=lambda x: x.similarity, reverse=True)
-        return results[:top_k]
+        return results
+
+    @staticmethod
+    def _character_metadata(character: Character) -> Dict[str, Any]:
+        """Get the metadata stored with a character's embedding."""
+        return {
+            "species": character.species,
+            "status": character.status,
+            "gender": character.gender
+        }
 
     def get_indexed_count(self) -> int:
         """
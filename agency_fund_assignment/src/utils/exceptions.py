@@ -16,14 +16,22 @@ class AppException(Exception):
         self.message = message
         self.status_code = status_code
         self.payload = payload or {}
+        self._dict_cache: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert exception to dictionary."""
-        return {
-            "success": False,
-            "error": self.message,
-            **self.payload
-        }
+        """
+        Convert exception to dictionary.
+
+        Built on first use and reused afterwards; callers must not
+        mutate the result.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "success": False,
+                "error": self.message,
+                **self.payload
+            }
+        return self._dict_cache
 
 
 class DatabaseError(AppException):
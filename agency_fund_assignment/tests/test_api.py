@@ -4,22 +4,39 @@ Tests all endpoints with valid inputs and edge cases.
 """
 import pytest
 import os
-from src.api import create_app
+from dataclasses import replace
+from unittest import mock
+from src import config as config_module
+from src.api import create_app, start_prefetch
 from src.config import get_config
+from src.database import get_db_connection
+from src.api.routes import locations as locations_routes
+from src.utils import ExternalAPIError
 
 
-@pytest.fixture
-def app():
-    """Create test application."""
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """Create test application once for the whole run, on a throwaway database."""
     config = get_config()
-    test_app = create_app(config)
-    test_app.config['TESTING'] = True
-    return test_app
+    db_path = tmp_path_factory.mktemp("db") / config.database.test_path
+    test_config = replace(config, database=replace(config.database, path=str(db_path)))
 
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # The app resolves its database through these singletons
+        monkeypatch.setattr(config_module, "_CONFIG", test_config)
+        get_db_connection.cache_clear()
 
-@pytest.fixture
+        test_app = create_app(test_config)
+        test_app.config['TESTING'] = True
+        yield test_app
+
+        get_db_connection().close_all()
+        get_db_connection.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def client(app):
-    """Create test client."""
+    """Create test client shared by all tests."""
     return app.test_client()
 
 
@@ -179,6 +196,34 @@ class TestNotesEndpoints:
         assert data['success'] is False
         assert 'error' in data
 
+    def test_add_notes_bulk(self, client):
+        """Test adding several notes in one request."""
+        notes_data = [
+            {'character_id': 3, 'character_name': 'Summer Smith', 'note': 'Older sister'},
+            {'character_id': 3, 'character_name': 'Summer Smith', 'note': 'Has a phone'}
+        ]
+
+        response = client.post('/api/notes/bulk', json=notes_data)
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['success'] is True
+        assert data['count'] == 2
+
+    def test_add_notes_bulk_missing_fields(self, client):
+        """Test bulk add rejects items with missing fields."""
+        notes_data = [
+            {'character_id': 3, 'character_name': 'Summer Smith', 'note': 'Older sister'},
+            {'character_id': 3, 'note': 'No name'}
+        ]
+
+        response = client.post('/api/notes/bulk', json=notes_data)
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'index 1' in data['error']
+
     def test_get_notes_for_character(self, client):
         """Test retrieving notes for a character."""
         # First add a note
@@ -244,5 +289,48 @@ class TestEdgeCases:
         assert response.status_code == 201
 
 
+class TestLocationsPayload:
+    """Test the cached body of the location list."""
+
+    def test_stale_body_is_served_during_outage(self, monkeypatch):
+        """Test a failed rebuild serves the old body and waits before retrying."""
+        now = [1000.0]
+        monkeypatch.setattr(locations_routes.time, 'monotonic', lambda: now[0])
+        service = mock.Mock()
+        service.get_all_locations.return_value = []
+        payload = locations_routes._LocationsPayload(service, ttl_seconds=3600)
+
+        body = payload.get()
+        service.get_all_locations.side_effect = ExternalAPIError("down")
+        now[0] += 3600
+
+        assert payload.get() == body
+        assert payload.get() == body
+        assert service.get_all_locations.call_count == 2
+
+        now[0] += locations_routes._RETRY_SECONDS
+        assert payload.get() == body
+        assert service.get_all_locations.call_count == 3
+
+    def test_prefetch_is_opt_in(self, app):
+        """Test creating the app only registers the warm-up for servers to start."""
+        assert len(app.extensions['prefetch']) == 1
+
+        flask_app = mock.Mock(extensions={'prefetch': [mock.sentinel.warm]})
+        with mock.patch('src.api.threading.Thread') as thread:
+            start_prefetch(flask_app)
+
+        thread.assert_called_once_with(target=mock.sentinel.warm, daemon=True)
+        thread.return_value.start.assert_called_once_with()
+
+    def test_outage_without_body_raises(self):
+        """Test there is nothing to fall back on before the first build."""
+        service = mock.Mock()
+        service.get_all_locations.side_effect = ExternalAPIError("down")
+
+        with pytest.raises(ExternalAPIError):
+            locations_routes._LocationsPayload(service, ttl_seconds=60).get()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -18,13 +18,13 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gemini_service():
     """Create GeminiService instance."""
     return GeminiService(config.gemini)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rick_morty_service():
     """Create RickMortyService instance."""
     db = get_db_connection()
@@ -32,7 +32,7 @@ def rick_morty_service():
     return RickMortyService(cache_repo, config.api)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def search_service(gemini_service, rick_morty_service):
     """Create SearchService instance."""
     db = get_db_connection()
@@ -0,0 +1,323 @@
+"""
+Repository and migration tests.
+Each test runs against a fresh temporary SQLite database.
+"""
+import sqlite3
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+import numpy as np
+import orjson
+import pytest
+
+from src.database import DatabaseConnection, init_database
+from src.database.migrations import MIGRATIONS, StoreTimestampsAsEpoch
+from src.repositories import (
+    CacheRepository,
+    EmbeddingCacheRepository,
+    EmbeddingRepository,
+    NoteRepository,
+)
+from src.repositories import base, cache_repository
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a migrated database in a temporary directory."""
+    connection = DatabaseConnection(str(tmp_path / "test.db"))
+    init_database(connection)
+    yield connection
+    connection.close_all()
+
+
+@pytest.fixture
+def cache_repo(db):
+    """Create CacheRepository instance."""
+    return CacheRepository(db)
+
+
+@pytest.fixture
+def embedding_repo(db):
+    """Create EmbeddingRepository instance."""
+    return EmbeddingRepository(db)
+
+
+def _unit(*values):
+    """Build a normalized float32 vector."""
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestInsertRows:
+    """Test multi-row inserts stay below SQLite's parameter limit."""
+
+    def test_statements_are_chunked(self):
+        """Test no statement binds more than the parameter limit."""
+        conn = mock.Mock()
+        rows = [(i, f"key-{i}", i * 2) for i in range(1000)]
+
+        count = base.BaseRepository._insert_rows(conn, "INSERT INTO t (a, b, c)", rows, width=3)
+
+        assert count == 1000
+        bound = [call.args[1] for call in conn.execute.call_args_list]
+        assert all(len(params) <= base._MAX_BIND_PARAMS for params in bound)
+        assert len(bound) == 4
+        assert [p for params in bound for p in params] == [v for row in rows for v in row]
+
+    def test_large_batch_is_written(self, cache_repo, db):
+        """Test a batch larger than one statement is fully written."""
+        count = cache_repo.set_many((f"key-{i}", {"i": i}) for i in range(1000))
+
+        assert count == 1000
+        row = db.execute("SELECT COUNT(*) AS count FROM api_cache", fetch_one=True)
+        assert row['count'] == 1000
+
+
+class TestCacheMemoryTier:
+    """Test the in-process LRU in front of the api_cache table."""
+
+    def test_get_returns_shared_payload(self, cache_repo):
+        """Test repeated reads return the payload stored in memory."""
+        cache_repo.set("key", {"name": "Rick"})
+
+        first = cache_repo.get("key")
+        assert first == {"name": "Rick"}
+        assert cache_repo.get("key") is first
+
+    def test_get_falls_back_to_table(self, cache_repo, db):
+        """Test entries written by another instance are read from SQLite."""
+        CacheRepository(db).set("key", {"name": "Morty"})
+
+        assert cache_repo.get("key") == {"name": "Morty"}
+        assert "key" in cache_repo._memory
+
+    def test_expired_entries_are_not_served(self, cache_repo):
+        """Test memory entries honour the row's TTL."""
+        cache_repo.set("key", {"name": "Rick"}, ttl_minutes=1)
+        later = time.time() + 120
+
+        with mock.patch.object(cache_repository.time, "time", return_value=later):
+            assert cache_repo.get("key") is None
+            assert cache_repo.get_many(["key"]) == {}
+        assert "key" not in cache_repo._memory
+
+    def test_delete_invalidates_memory(self, cache_repo):
+        """Test deleted entries are not served from memory."""
+        cache_repo.set("key", {"name": "Rick"})
+
+        assert cache_repo.delete("key") is True
+        assert cache_repo.get("key") is None
+
+    def test_clear_all_invalidates_memory(self, cache_repo):
+        """Test clearing the cache also clears memory."""
+        cache_repo.set("key", {"name": "Rick"})
+        cache_repo.clear_all()
+
+        assert cache_repo.get("key") is None
+
+    def test_least_recently_used_is_evicted(self, cache_repo, monkeypatch):
+        """Test the memory tier keeps only the most recent entries."""
+        monkeypatch.setattr(cache_repository, "_MEMORY_CACHE_SIZE", 2)
+        cache_repo.set_many([("a", {"v": 1}), ("b", {"v": 2})])
+        cache_repo.get("a")
+        cache_repo.set("c", {"v": 3})
+
+        assert list(cache_repo._memory) == ["a", "c"]
+        # Evicted entries are still read from the table
+        assert cache_repo.get("b") == {"v": 2}
+
+    def test_get_many(self, cache_repo, db):
+        """Test bulk reads from memory and SQLite together."""
+        cache_repo.set("a", {"v": 1})
+        CacheRepository(db).set("b", {"v": 2})
+
+        found = cache_repo.get_many(["a", "b", "missing", "a"])
+
+        assert found == {"a": {"v": 1}, "b": {"v": 2}}
+
+    def test_get_raw(self, cache_repo):
+        """Test the stored JSON is returned undecoded."""
+        cache_repo.set("key", {"name": "Rick"})
+
+        assert orjson.loads(cache_repo.get_raw("key")) == {"name": "Rick"}
+        assert cache_repo.get_raw("missing") is None
+
+    def test_head(self, cache_repo, db):
+        """Test existence checks from memory and SQLite, honouring the TTL."""
+        cache_repo.set("a", {"v": 1}, ttl_minutes=1)
+        CacheRepository(db).set("b", {"v": 2}, ttl_minutes=1)
+
+        assert cache_repo.head("a") is True
+        assert cache_repo.head("b") is True
+        assert cache_repo.head("missing") is False
+
+        later = time.time() + 120
+        with mock.patch.object(cache_repository.time, "time", return_value=later):
+            assert cache_repo.head("a") is False
+            assert cache_repo.head("b") is False
+            assert cache_repo.get_raw("a") is None
+
+
+class TestEmbeddingRepository:
+    """Test embedding storage and bulk reads."""
+
+    def test_get_many(self, embedding_repo):
+        """Test bulk reads return only stored, normalized vectors."""
+        embedding_repo.save_many([
+            (1, "Rick", [3.0, 4.0], None),
+            (2, "Morty", [0.0, 2.0], None),
+        ])
+
+        embeddings = embedding_repo.get_many([2, 1, 3, 1])
+
+        assert set(embeddings) == {1, 2}
+        np.testing.assert_allclose(embeddings[1], _unit(3, 4), atol=0.01)
+        np.testing.assert_allclose(embeddings[2], _unit(0, 1), atol=0.01)
+
+    def test_get_many_chunks_large_lookups(self, embedding_repo):
+        """Test lookups larger than one IN chunk are complete."""
+        embedding_repo.save_many((i, f"C{i}", [1.0, float(i)], None) for i in range(1, 1001))
+
+        assert len(embedding_repo.get_many(range(1, 1001))) == 1000
+
+    def test_exists_many(self, embedding_repo):
+        """Test bulk existence check."""
+        embedding_repo.save_many([(1, "Rick", [1.0, 0.0], None), (3, "Summer", [0.0, 1.0], None)])
+
+        assert embedding_repo.exists_many([1, 2, 3]) == {1, 3}
+        assert embedding_repo.exists_many([]) == set()
+
+    def test_iter_all(self, embedding_repo):
+        """Test streaming all rows with decoded metadata."""
+        embedding_repo.save_many([
+            (1, "Rick", [1.0, 0.0], {"species": "Human"}),
+            (2, "Morty", [0.0, 1.0], None),
+        ])
+
+        rows = sorted(embedding_repo.iter_all(), key=lambda row: row[0])
+
+        assert [(row[0], row[1], row[3]) for row in rows] == [
+            (1, "Rick", {"species": "Human"}),
+            (2, "Morty", None),
+        ]
+        np.testing.assert_allclose(rows[0][2], [1.0, 0.0], atol=0.01)
+
+    def test_get_all_with_fields(self, embedding_repo):
+        """Test selected metadata fields are extracted per row."""
+        embedding_repo.save_many([
+            (1, "Rick", [1.0, 0.0], {"species": "Human", "status": "Alive"}),
+            (2, "Morty", [0.0, 1.0], None),
+        ])
+
+        rows = sorted(embedding_repo.get_all_with_fields(["species", "status"]), key=lambda row: row['character_id'])
+
+        assert [{k: v for k, v in row.items() if k != 'embedding'} for row in rows] == [
+            {'character_id': 1, 'character_name': "Rick", 'species': "Human", 'status': "Alive"},
+            {'character_id': 2, 'character_name': "Morty", 'species': None, 'status': None},
+        ]
+        np.testing.assert_allclose(rows[1]['embedding'], [0.0, 1.0], atol=0.01)
+
+    @pytest.mark.parametrize("field", ['species"', "a.b", "1st", "", "x; DROP TABLE character_embeddings"])
+    def test_get_all_with_fields_rejects_invalid_names(self, embedding_repo, field):
+        """Test field names that are not plain identifiers are refused."""
+        with pytest.raises(ValueError):
+            embedding_repo.get_all_with_fields([field])
+
+    def test_index_tracks_changes(self, embedding_repo):
+        """Test the cached index is rebuilt after writes."""
+        embedding_repo.save(1, "Rick", [1.0, 0.0])
+        assert len(embedding_repo.get_index()) == 1
+
+        embedding_repo.save(2, "Morty", [0.0, 1.0])
+        index = embedding_repo.get_index()
+
+        assert list(index.character_ids) == [1, 2]
+        rows, scores = index.k_nearest(np.array([0.0, 1.0]), 1)
+        assert list(index.character_ids[rows]) == [2]
+        assert scores[0] == pytest.approx(1.0, abs=0.01)
+
+
+class TestEmbeddingCacheRepository:
+    """Test the persistent embedding cache."""
+
+    def test_round_trip(self, db):
+        """Test cached vectors are returned per text."""
+        repo = EmbeddingCacheRepository(db)
+        assert repo.set_many({"a": [0.5, 1.5], "b": [2.0, -1.0]}, "model", "retrieval_document") == 2
+
+        found = repo.get_many(["a", "b", "c"], "model", "retrieval_document")
+
+        assert found == {"a": [0.5, 1.5], "b": [2.0, -1.0]}
+
+    def test_keyed_by_model_and_task_type(self, db):
+        """Test entries only match the model and task type they were computed with."""
+        repo = EmbeddingCacheRepository(db)
+        repo.set_many({"a": [1.0]}, "model", "retrieval_document")
+
+        assert repo.get_many(["a"], "other-model", "retrieval_document") == {}
+        assert repo.get_many(["a"], "model", "retrieval_query") == {}
+
+    def test_large_lookups(self, db):
+        """Test lookups larger than one IN chunk are complete."""
+        repo = EmbeddingCacheRepository(db)
+        texts = [f"text {i}" for i in range(1000)]
+        repo.set_many({text: [float(i)] for i, text in enumerate(texts)}, "model", "retrieval_document")
+
+        assert len(repo.get_many(texts, "model", "retrieval_document")) == 1000
+
+
+class TestTimestampMigration:
+    """Test StoreTimestampsAsEpoch on a database created before it."""
+
+    @pytest.fixture
+    def local_timezone(self, monkeypatch):
+        """Run in a timezone that differs from UTC."""
+        if not hasattr(time, "tzset"):
+            pytest.skip("time.tzset is not available")
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    def test_old_timestamps_are_converted(self, tmp_path, local_timezone):
+        """Test UTC defaults and local datetime.now() edits map to the same instant."""
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        for migration in MIGRATIONS[:MIGRATIONS.index(StoreTimestampsAsEpoch)]:
+            for statement in migration.get_statements():
+                conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {MIGRATIONS.index(StoreTimestampsAsEpoch)}")
+
+        edited_at = datetime(2024, 1, 15, 13, 30, 0, 250000)
+        conn.execute(
+            "INSERT INTO character_notes (character_id, character_name, note, created_at, updated_at) "
+            "VALUES (1, 'Rick', 'untouched', '2024-01-15 18:30:00', '2024-01-15 18:30:00')"
+        )
+        conn.execute(
+            "INSERT INTO character_notes (character_id, character_name, note, created_at, updated_at) "
+            "VALUES (1, 'Rick', 'edited', '2024-01-15 18:30:00', ?)",
+            (edited_at.isoformat(" "),)
+        )
+        conn.commit()
+        conn.close()
+
+        db = DatabaseConnection(path)
+        try:
+            init_database(db)
+            rows = db.execute(
+                "SELECT note, created_at, updated_at FROM character_notes ORDER BY id",
+                fetch_all=True
+            )
+            notes = NoteRepository(db).get_by_character_id(1)
+        finally:
+            db.close_all()
+
+        expected = int(datetime(2024, 1, 15, 18, 30, tzinfo=timezone.utc).timestamp())
+        assert [tuple(row) for row in rows] == [
+            ("untouched", expected, expected),
+            ("edited", expected, expected),
+        ]
+        assert {note.created_at for note in notes} == {datetime(2024, 1, 15, 18, 30)}
+        assert {note.updated_at for note in notes} == {datetime(2024, 1, 15, 18, 30)}
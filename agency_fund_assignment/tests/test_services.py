@@ -0,0 +1,306 @@
+"""
+Service tests with the HTTP API and Gemini SDK mocked out.
+Caches run against a fresh temporary SQLite database.
+"""
+from unittest import mock
+
+import numpy as np
+import orjson
+import pytest
+import requests
+
+from src.config import APIConfig, GeminiConfig
+from src.database import DatabaseConnection, init_database
+from src.repositories import CacheRepository, EmbeddingCacheRepository
+from src.services import GeminiService, RickMortyService, SearchService
+from src.services.image_service import ImageGenerationService
+from src.utils import DatabaseError, ExternalAPIError
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a migrated database in a temporary directory."""
+    connection = DatabaseConnection(str(tmp_path / "test.db"))
+    init_database(connection)
+    yield connection
+    connection.close_all()
+
+
+def _character(character_id):
+    """Build a character payload as returned by the API."""
+    return {
+        "id": character_id,
+        "name": f"Character {character_id}",
+        "status": "Alive",
+        "species": "Human",
+        "type": "",
+        "gender": "Male",
+        "origin": {"name": "Earth", "url": ""},
+        "location": {"name": "Earth", "url": ""},
+        "image": "",
+        "episode": [],
+        "url": "",
+        "created": ""
+    }
+
+
+def _response(body):
+    """Build a successful HTTP response."""
+    response = mock.Mock()
+    response.content = orjson.dumps(body)
+    return response
+
+
+class FakeCharacterAPI:
+    """Serve character endpoints for IDs below `known_below`."""
+
+    def __init__(self, known_below=100):
+        self.known_below = known_below
+        self.endpoints = []
+
+    def __call__(self, url, params=None, timeout=None):
+        endpoint = url.split("/api/", 1)[1]
+        self.endpoints.append(endpoint)
+        ids = endpoint.split("/", 1)[1].split(",")
+        found = [_character(int(i)) for i in ids if int(i) < self.known_below]
+
+        if len(ids) > 1:
+            return _response(found)
+        if not found:
+            error = requests.exceptions.HTTPError(response=mock.Mock(status_code=404))
+            response = mock.Mock()
+            response.raise_for_status.side_effect = error
+            return response
+        return _response(found[0])
+
+
+@pytest.fixture
+def rick_morty_service(db):
+    """Create RickMortyService with a fake character API."""
+    service = RickMortyService(CacheRepository(db), APIConfig())
+    service._session.get = FakeCharacterAPI()
+    return service
+
+
+@pytest.fixture
+def gemini_service(db):
+    """Create GeminiService with the SDK mocked out."""
+    service = GeminiService(
+        GeminiConfig(api_key="test-key"),
+        embedding_cache=EmbeddingCacheRepository(db)
+    )
+    service._genai = mock.Mock()
+    service._genai.embed_content.side_effect = lambda model, content, task_type: {
+        "embedding": [[float(len(text)), 1.0] for text in content]
+    }
+    return service
+
+
+class TestGetCharacters:
+    """Test bulk character lookups."""
+
+    def test_batches_and_preserves_order(self, rick_morty_service):
+        """Test one multi-ID request, results in first-requested order."""
+        characters = rick_morty_service.get_characters([3, 1, 2, 1])
+
+        assert [character.id for character in characters] == [3, 1, 2]
+        assert rick_morty_service._session.get.endpoints == ["character/3,1,2"]
+
+    def test_cached_characters_are_not_refetched(self, rick_morty_service):
+        """Test characters fetched in a batch are reused individually."""
+        rick_morty_service.get_characters([1, 2])
+        api = rick_morty_service._session.get
+        api.endpoints.clear()
+
+        characters = rick_morty_service.get_characters([2, 1, 3])
+        assert [character.id for character in characters] == [2, 1, 3]
+        assert api.endpoints == ["character/3"]
+
+        api.endpoints.clear()
+        assert rick_morty_service.get_character(1).id == 1
+        assert api.endpoints == []
+
+    def test_large_requests_are_split(self, rick_morty_service):
+        """Test lookups are split into batches of at most 100 IDs."""
+        rick_morty_service._session.get.known_below = 1000
+
+        characters = rick_morty_service.get_characters(range(1, 251))
+
+        assert [character.id for character in characters] == list(range(1, 251))
+        assert sorted(
+            len(endpoint.split(",")) for endpoint in rick_morty_service._session.get.endpoints
+        ) == [50, 100, 100]
+
+    def test_missing_characters_are_left_out(self, rick_morty_service):
+        """Test IDs the API does not know are skipped."""
+        assert [c.id for c in rick_morty_service.get_characters([1, 500, 2])] == [1, 2]
+        assert rick_morty_service.get_characters([500]) == []
+
+    def test_api_failures_raise(self, rick_morty_service):
+        """Test an outage is reported instead of returning no characters."""
+        rick_morty_service._session.get = mock.Mock(
+            side_effect=requests.exceptions.ConnectionError("unreachable")
+        )
+
+        with pytest.raises(ExternalAPIError):
+            rick_morty_service.get_characters([1, 2])
+
+
+class TestCosineSimilarityBatch:
+    """Test batched cosine similarity."""
+
+    def test_scores_each_row(self):
+        """Test similarities against every row, zero for zero-length rows."""
+        scores = GeminiService.cosine_similarity_batch(
+            [1.0, 0.0],
+            [[2.0, 0.0], [0.0, 3.0], [1.0, 1.0], [0.0, 0.0]]
+        )
+
+        np.testing.assert_allclose(scores, [1.0, 0.0, np.sqrt(0.5), 0.0], rtol=1e-6)
+
+    def test_matches_single_cosine(self):
+        """Test the batch agrees with the single-pair helper."""
+        rng = np.random.default_rng(0)
+        query, corpus = rng.normal(size=8), rng.normal(size=(5, 8))
+
+        scores = GeminiService.cosine_similarity_batch(query, corpus)
+
+        for row, score in zip(corpus, scores):
+            assert score == pytest.approx(GeminiService.cosine_similarity(query, row), rel=1e-5)
+
+    def test_empty_corpus(self):
+        """Test an empty corpus gives no scores."""
+        assert GeminiService.cosine_similarity_batch([1.0, 0.0], []).shape == (0,)
+
+    @pytest.mark.parametrize("corpus", [[[1.0, 0.0, 0.0]], [1.0, 0.0, 1.0, 0.0]])
+    def test_dimension_mismatch(self, corpus):
+        """Test corpora that are not (N, D) are rejected."""
+        with pytest.raises(ValueError):
+            GeminiService.cosine_similarity_batch([1.0, 0.0], corpus)
+
+
+class TestParseEvaluationResponse:
+    """Test parsing of evaluation responses."""
+
+    def test_parses_fields(self):
+        """Test score, reasoning and extra fields are extracted."""
+        result = GeminiService._parse_evaluation_response(
+            "Score: 7\nReasoning: Mostly accurate.\nIssues: None\n"
+        )
+
+        assert result.score == 7
+        assert result.reasoning == "Mostly accurate."
+        assert result.details == {"Issues": "None"}
+
+    @pytest.mark.parametrize("value, score", [("8/10", 8), ("12", 10), ("n/a", 0), (" 9 ", 9)])
+    def test_score_formats(self, value, score):
+        """Test the first number is the score, capped at 10."""
+        assert GeminiService._parse_evaluation_response(f"Score: {value}").score == score
+
+    def test_missing_fields(self):
+        """Test responses without fields score 0."""
+        result = GeminiService._parse_evaluation_response("No structure here")
+
+        assert result.score == 0
+        assert result.reasoning == ""
+        assert result.details == {}
+
+
+class TestEmbeddingCache:
+    """Test persistent caching of Gemini embeddings."""
+
+    def test_document_embeddings_are_reused(self, gemini_service, db):
+        """Test documents embedded before are not sent to the SDK again."""
+        first = gemini_service.generate_embeddings(["Rick", "Morty"])
+        second = gemini_service.generate_embeddings(["Morty", "Summer", "Rick"])
+
+        assert second == [first[1], [6.0, 1.0], first[0]]
+        contents = [call.kwargs["content"] for call in gemini_service._genai.embed_content.call_args_list]
+        assert contents == [["Rick", "Morty"], ["Summer"]]
+
+    def test_query_embeddings_are_not_persisted(self, gemini_service, db):
+        """Test one-off queries do not grow the embedding cache."""
+        gemini_service.generate_query_embedding("who is pickle rick")
+        gemini_service.generate_query_embedding("who is pickle rick")
+
+        assert gemini_service._genai.embed_content.call_count == 2
+        row = db.execute("SELECT COUNT(*) AS count FROM embedding_cache", fetch_one=True)
+        assert row['count'] == 0
+
+
+class TestVerifyImageUrls:
+    """Test concurrent image URL checks."""
+
+    def test_results_follow_input_order(self):
+        """Test each URL is checked with a ranged GET, results in input order."""
+        statuses = {"https://img/ok": 200, "https://img/partial": 206, "https://img/gone": 404}
+
+        def fake_get(url, **kwargs):
+            if url == "https://img/down":
+                raise requests.exceptions.ConnectionError("unreachable")
+            response = mock.MagicMock()
+            response.__enter__.return_value.status_code = statuses[url]
+            return response
+
+        service = ImageGenerationService()
+        service._session.get = mock.Mock(side_effect=fake_get)
+        urls = ["https://img/gone", "https://img/ok", "https://img/down", "https://img/partial"]
+
+        assert service.verify_image_urls(urls) == [False, True, False, True]
+        assert all(
+            call.kwargs['headers'] == {'Range': 'bytes=0-0'}
+            for call in service._session.get.call_args_list
+        )
+
+    def test_no_urls(self):
+        """Test an empty list needs no requests."""
+        service = ImageGenerationService()
+        service._session.get = mock.Mock()
+
+        assert service.verify_image_urls([]) == []
+        service._session.get.assert_not_called()
+
+
+class TestIndexingFailures:
+    """Test indexing failures are reported through the module logger."""
+
+    @pytest.fixture
+    def search_service(self):
+        """Create SearchService with mocked dependencies."""
+        return SearchService(mock.Mock(), mock.Mock(), mock.Mock())
+
+    def test_index_character_failure(self, search_service, caplog):
+        """Test a single failure is logged as a warning."""
+        search_service.embedding_repo.exists.return_value = False
+        search_service.rick_morty_service.get_character.side_effect = ExternalAPIError("down")
+
+        with caplog.at_level("WARNING", logger="src.services.search_service"):
+            assert search_service.index_character(1) is False
+
+        assert caplog.messages == ["Failed to index character 1: down"]
+
+    def test_index_characters_failures(self, search_service, caplog):
+        """Test fetch and lookup failures are logged once per batch."""
+        search_service.embedding_repo.exists_many.return_value = set()
+        search_service.rick_morty_service.get_characters.side_effect = ExternalAPIError("down")
+
+        with caplog.at_level("WARNING", logger="src.services.search_service"):
+            result = search_service.index_characters([1, 2, 1])
+
+        assert result == {
+            "indexed_count": 0,
+            "errors": [
+                {"character_id": 1, "error": "Failed to index"},
+                {"character_id": 2, "error": "Failed to index"}
+            ]
+        }
+        assert caplog.messages == [
+            "Failed to fetch characters for indexing: down",
+            "Failed to index characters [1, 2]: characters could not be fetched"
+        ]
+
+        caplog.clear()
+        search_service.embedding_repo.exists_many.side_effect = DatabaseError("locked")
+        with caplog.at_level("WARNING", logger="src.services.search_service"):
+            assert search_service.index_characters([3])["indexed_count"] == 0
+        assert caplog.messages == ["Failed to index characters [3]: locked"]
@@ -0,0 +1,10 @@
+"""
+WSGI entry point for production servers.
+
+Run with:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from src.api import create_app
+
+app = create_app()